@@ -38,23 +38,27 @@ __version__ = "1.0.2"
 __author__ = "Sean Nieuwoudt"
 __license__ = "MIT"
 
-from .core import (
-    PluginBase,
-    PluginManager,
-    HookRegistry,
-    NitroPluginError,
-    PluginLoadError,
-    PluginRegistrationError,
-    HookError,
-    PluginNotFoundError,
-    DependencyError,
-    StopPropagation,
-    HookTimeoutError,
-    ValidationError,
-    PluginDiscoveryError,
-)
+from typing import TYPE_CHECKING, Any, List
+
 from .utils import hook
 
+if TYPE_CHECKING:
+    from .core import (
+        PluginBase,
+        PluginManager,
+        HookRegistry,
+        NitroPluginError,
+        PluginLoadError,
+        PluginRegistrationError,
+        HookError,
+        PluginNotFoundError,
+        DependencyError,
+        StopPropagation,
+        HookTimeoutError,
+        ValidationError,
+        PluginDiscoveryError,
+    )
+
 __all__ = [
     "PluginManager",
     "PluginBase",
@@ -71,3 +75,22 @@ __all__ = [
     "ValidationError",
     "PluginDiscoveryError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import core symbols on first access (PEP 562).
+
+    Keeps ``import nitro_dispatch`` (and ``from nitro_dispatch import hook``)
+    from pulling in the manager and its dependencies until they are used.
+    """
+    if name in __all__:
+        from . import core
+
+        value = getattr(core, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
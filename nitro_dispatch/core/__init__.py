@@ -2,21 +2,42 @@
 Core components of Nitro Plugins.
 """
 
-from .plugin_base import PluginBase
-from .plugin_manager import PluginManager
-from .hook_registry import HookRegistry
-from .exceptions import (
-    NitroPluginError,
-    PluginLoadError,
-    PluginRegistrationError,
-    HookError,
-    PluginNotFoundError,
-    DependencyError,
-    StopPropagation,
-    HookTimeoutError,
-    ValidationError,
-    PluginDiscoveryError,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .plugin_base import PluginBase
+    from .plugin_manager import PluginManager
+    from .hook_registry import HookRegistry
+    from .exceptions import (
+        NitroPluginError,
+        PluginLoadError,
+        PluginRegistrationError,
+        HookError,
+        PluginNotFoundError,
+        DependencyError,
+        StopPropagation,
+        HookTimeoutError,
+        ValidationError,
+        PluginDiscoveryError,
+    )
+
+# Public name -> submodule defining it, imported on first access.
+_LAZY = {
+    "PluginBase": ".plugin_base",
+    "PluginManager": ".plugin_manager",
+    "HookRegistry": ".hook_registry",
+    "NitroPluginError": ".exceptions",
+    "PluginLoadError": ".exceptions",
+    "PluginRegistrationError": ".exceptions",
+    "HookError": ".exceptions",
+    "PluginNotFoundError": ".exceptions",
+    "DependencyError": ".exceptions",
+    "StopPropagation": ".exceptions",
+    "HookTimeoutError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "PluginDiscoveryError": ".exceptions",
+}
 
 __all__ = [
     "PluginBase",
@@ -33,3 +54,17 @@ __all__ = [
     "ValidationError",
     "PluginDiscoveryError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a core submodule on first access to one of its names (PEP 562)."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
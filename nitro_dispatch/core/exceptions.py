@@ -78,6 +78,10 @@ class StopPropagation(NitroPluginError):
     priority) will not run. The current accumulated data is returned to the
     caller of :meth:`trigger` / :meth:`trigger_async`.
 
+    A hook may also ``return StopPropagation`` (the class itself) for the
+    same effect without raising; that is the cheaper option on hot events,
+    while raising lets you attach a reason for the log.
+
     Example:
         >>> class Gatekeeper(PluginBase):
         ...     name = "gatekeeper"
@@ -86,6 +90,8 @@ class StopPropagation(NitroPluginError):
         ...     def deny_banned(self, data):
         ...         if data.get("banned"):
         ...             raise StopPropagation("user is banned")
+        ...         if data.get("guest"):
+        ...             return StopPropagation
         ...         return data
     """
 
@@ -1,16 +1,333 @@
 """Hook registry: event subscriptions and sync/async dispatch."""
 
 import asyncio
+import collections
 import concurrent.futures
+import functools
+import heapq
+import inspect
+import os
 import re
-from typing import Any, Callable, Dict, List, Optional
+import sys
+import threading
+from time import perf_counter_ns
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 import logging
 
 from .exceptions import HookError, StopPropagation, HookTimeoutError
+from .plugin_base import PluginBase
 
 logger = logging.getLogger(__name__)
 
 
+class _TrieNode:
+    """One literal event-name segment in the wildcard pattern trie.
+
+    ``children`` maps the next literal segment to its node. ``wildcards``
+    maps a pattern remainder (from the first segment containing ``*``) to a
+    ``(full pattern, remainder matcher)`` pair. ``prefilter`` is a combined
+    matcher for all of ``wildcards``, built on demand and reset whenever
+    they change.
+    """
+
+    __slots__ = ("children", "wildcards", "prefilter")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.wildcards: Dict[str, Tuple[str, Callable[[str], Any]]] = {}
+        self.prefilter: Optional[Callable[[str], Any]] = None
+
+
+# The property whose setter bumps ``PluginBase._state_version``. Plugins
+# exposing ``enabled`` any other way can't signal changes and are re-read on
+# every dispatch.
+_TRACKED_ENABLED = PluginBase.__dict__["enabled"]
+
+# ``asyncio.timeout`` context manager on Python 3.11+, else ``None`` and async
+# hook timeouts fall back to ``asyncio.wait_for``.
+_async_timeout = getattr(asyncio, "timeout", None)
+
+# Number of hook executions kept by the tracing ring buffer.
+_TRACE_SIZE = 10_000
+
+# Maximum number of resolved hook tuples kept per registry; the least
+# recently used event name is evicted beyond this.
+_RESOLVE_CACHE_SIZE = 1024
+# Maximum number of generated dispatchers kept per registry before the table
+# is reset.
+_DISPATCHER_CACHE_SIZE = 1024
+
+# Number of triggers an event needs before a dispatcher is generated for it;
+# rarer events stay on the interpreted loop and never pay for compilation.
+_COMPILE_THRESHOLD = 16
+
+# Workers in the shared pool for sync hooks with a timeout (the
+# ``ThreadPoolExecutor`` default). Once that many are busy, e.g. with hooks
+# still running past their timeout, further timed hooks fail fast with
+# HookTimeoutError instead of waiting in the pool's queue on the clock.
+_TIMEOUT_POOL_SIZE = min(32, (os.cpu_count() or 1) + 4)
+
+# Wildcard remainders a trie node needs before one combined regex is tried
+# first, so a non-matching event is rejected in a single match call.
+_PREFILTER_MIN = 4
+
+
+# Keys of the dict each hook used to be stored as, exposed by HookInfo's
+# mapping protocol.
+_HOOK_INFO_KEYS = (
+    "callback",
+    "plugin",
+    "plugin_name",
+    "priority",
+    "timeout",
+    "is_async",
+    "parallel",
+)
+
+
+class HookInfo:
+    """A registered hook, as stored by the registry and returned by ``get_hooks``.
+
+    Slotted for compact storage and fast attribute reads on the dispatch
+    path. For code written against the former dict representation, it
+    also supports the read-only mapping protocol: ``hook["priority"]``,
+    ``hook.get("priority")``, ``"priority" in hook``, ``keys()``,
+    ``items()``, iteration and ``dict(hook)``, over the dict's keys
+    (``callback``, ``plugin``, ``plugin_name``, ``priority``, ``timeout``,
+    ``is_async``, ``parallel``). The bookkeeping fields ``seq``, ``bit``
+    and ``on_error`` can still be read by name but are not listed.
+
+    Attributes:
+        callback: The registered callable.
+        plugin: Owning plugin instance, or ``None`` for anonymous hooks.
+        plugin_name: ``plugin.name``, or ``"anonymous"``.
+        priority: Higher values run earlier.
+        timeout: Per-call limit in seconds, or ``None``.
+        is_async: Whether the callback is awaited.
+        parallel: Whether the hook may be gathered with its priority tier.
+        seq: Registration order, used to break priority ties.
+        bit: The plugin's slot in the registry's enabled bitmask.
+        on_error: The plugin's ``on_error`` handler, looked up once at
+            registration, or ``None``.
+    """
+
+    __slots__ = (
+        "callback",
+        "plugin",
+        "plugin_name",
+        "priority",
+        "timeout",
+        "is_async",
+        "parallel",
+        "seq",
+        "bit",
+        "on_error",
+    )
+
+    def __init__(
+        self,
+        callback: Callable,
+        plugin: Optional[Any],
+        plugin_name: str,
+        priority: int,
+        timeout: Optional[float],
+        is_async: bool,
+        parallel: bool,
+        seq: int,
+        bit: int,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        self.callback = callback
+        self.plugin = plugin
+        self.plugin_name = plugin_name
+        self.priority = priority
+        self.timeout = timeout
+        self.is_async = is_async
+        self.parallel = parallel
+        self.seq = seq
+        self.bit = bit
+        self.on_error = on_error
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by name, or ``default`` if there is no such field."""
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def __contains__(self, key: object) -> bool:
+        return key in _HOOK_INFO_KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_HOOK_INFO_KEYS)
+
+    def keys(self) -> Tuple[str, ...]:
+        """Return the field names of the former dict representation."""
+        return _HOOK_INFO_KEYS
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Return ``(name, value)`` pairs for the fields listed by :meth:`keys`."""
+        return [(key, getattr(self, key)) for key in _HOOK_INFO_KEYS]
+
+    def __repr__(self) -> str:
+        return (
+            f"HookInfo(plugin_name={self.plugin_name!r}, priority={self.priority}, "
+            f"callback={self.callback!r})"
+        )
+
+
+def _insort_by_priority(hooks: List[HookInfo], hook_info: HookInfo) -> None:
+    """Insert a hook into a priority-sorted list, after equal priorities.
+
+    Keeps ``hooks`` ordered by descending priority with registration order
+    preserved among ties, via binary search instead of a full re-sort.
+    """
+    priority = hook_info.priority
+    low, high = 0, len(hooks)
+    while low < high:
+        mid = (low + high) // 2
+        if hooks[mid].priority < priority:
+            high = mid
+        else:
+            low = mid + 1
+    hooks.insert(low, hook_info)
+
+
+def _pattern_source(pattern: str) -> str:
+    """Translate a wildcard pattern to unanchored regex source.
+
+    Everything but ``*`` is literal, as in the single-star
+    ``startswith`` / ``endswith`` matchers, so regex metacharacters in
+    event names are escaped.
+    """
+    return ".*".join(map(re.escape, pattern.split("*")))
+
+
+@functools.lru_cache(maxsize=256)
+def _pattern_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile a wildcard pattern to an anchored regex, once per pattern."""
+    return re.compile(f"^{_pattern_source(pattern)}$")
+
+
+def _compile_prefilter(remainders: Iterable[str]) -> Callable[[str], Any]:
+    """Build one matcher that accepts anything any of ``remainders`` matches.
+
+    The alternation may accept an event without saying which remainders
+    matched, so callers still run the per-pattern matchers afterwards;
+    its job is rejecting the common non-matching event in one call.
+    """
+    alternation = "|".join(f"(?:{_pattern_source(remainder)})" for remainder in remainders)
+    return re.compile(f"^(?:{alternation})$").match
+
+
+def _compile_wildcard(remainder: str) -> Callable[[str], Any]:
+    """Build a matcher for the wildcard part of a pattern.
+
+    ``*`` matches any run of characters, dots included. Patterns with a
+    single ``*`` reduce to ``str.startswith`` / ``str.endswith`` tests;
+    anything else uses the precompiled regex's ``match``.
+    """
+    if remainder.count("*") != 1:
+        return _pattern_regex(remainder).match
+
+    prefix, suffix = remainder.split("*")
+    if not suffix:
+        if not prefix:
+            return lambda event: True
+        return lambda event: event.startswith(prefix)
+    if not prefix:
+        return lambda event: event.endswith(suffix)
+
+    min_length = len(prefix) + len(suffix)
+    return lambda event: (
+        len(event) >= min_length and event.startswith(prefix) and event.endswith(suffix)
+    )
+
+
+def _unregister_key(callback: Callable, plugin: Optional[Any]) -> Tuple[Any, int]:
+    """Key identifying a ``(callback, plugin)`` pair in the unregister index.
+
+    Callbacks compare by equality, so a fresh bound method of the same
+    function and instance finds its hook; plugins compare by identity.
+    Unhashable callables fall back to identity.
+    """
+    try:
+        hash(callback)
+    except TypeError:
+        return (id(callback), id(plugin))
+    return (callback, id(plugin))
+
+
+def _hook_order(hook_info: HookInfo) -> Any:
+    """Sort key: higher priority first, then registration order."""
+    return (-hook_info.priority, hook_info.seq)
+
+
+def _continue_after_error(
+    message: Tuple[str, Tuple[Any, ...]],
+    error: Exception,
+    plugin_name: str,
+    event_name: str,
+    errors: Optional[List[Dict[str, Any]]],
+) -> Optional[List[Dict[str, Any]]]:
+    """``log_and_continue``: the error is already logged; run the next hook."""
+    return errors
+
+
+def _raise_after_error(
+    message: Tuple[str, Tuple[Any, ...]],
+    error: Exception,
+    plugin_name: str,
+    event_name: str,
+    errors: Optional[List[Dict[str, Any]]],
+) -> Optional[List[Dict[str, Any]]]:
+    """``fail_fast``: abort the chain with a :class:`HookError`."""
+    template, args = message
+    raise HookError(template % args) from error
+
+
+def _collect_after_error(
+    message: Tuple[str, Tuple[Any, ...]],
+    error: Exception,
+    plugin_name: str,
+    event_name: str,
+    errors: Optional[List[Dict[str, Any]]],
+) -> Optional[List[Dict[str, Any]]]:
+    """``collect_all``: record the error for the end-of-dispatch summary."""
+    if errors is None:
+        errors = []
+    errors.append(
+        {
+            "plugin": plugin_name,
+            "error": error,
+            "event": event_name,
+        }
+    )
+    return errors
+
+
+# Error strategy name -> handler applied after a hook error is logged, so
+# set_error_strategy() resolves the name once instead of per error.
+_ERROR_STRATEGIES: Dict[str, Callable[..., Optional[List[Dict[str, Any]]]]] = {
+    "log_and_continue": _continue_after_error,
+    "fail_fast": _raise_after_error,
+    "collect_all": _collect_after_error,
+}
+
+
 class HookRegistry:
     """Event bus storing hooks and dispatching them to listeners.
 
@@ -27,19 +344,77 @@ class HookRegistry:
 
     Features:
         - Priority-based execution with deterministic ordering.
-        - Per-hook timeout (thread-based for sync, ``asyncio.wait_for``
-          for async).
-        - Wildcard event matching (``"user.*"``, ``"db.before_*"``).
+        - Per-hook timeout (a shared, lazily created worker pool for
+          sync, ``asyncio.timeout`` — or ``asyncio.wait_for`` before
+          Python 3.11 — for async).
+        - Wildcard event matching (``"user.*"``, ``"db.before_*"``),
+          indexed in a segment trie and memoized per concrete event name
+          in a plain dict.
         - :class:`StopPropagation` to halt the chain from a hook.
         - Plugin-level enable/disable: hooks from disabled plugins are
           skipped without unregistering.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty registry with the default error strategy."""
-        self._hooks: Dict[str, List[Dict[str, Any]]] = {}
+    def __init__(
+        self,
+        inline_sync_hooks: bool = False,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        """Initialize an empty registry with the default error strategy.
+
+        Args:
+            inline_sync_hooks: Run sync hooks without a timeout directly on
+                the event loop thread in :meth:`trigger_async`, instead of
+                handing each one to the default executor. Only suitable
+                when sync hooks are quick and never block.
+            executor: Executor that :meth:`trigger_async` runs sync hooks
+                on, sized for the application's plugin concurrency. The
+                registry does not shut it down. Defaults to the event
+                loop's default executor.
+        """
+        self._inline_sync_hooks: bool = inline_sync_hooks
+        self._executor: Optional[concurrent.futures.Executor] = executor
+        self._hooks: Dict[str, List[HookInfo]] = {}
+        # Hooks per event keyed by _unregister_key(), so unregister() finds
+        # its matches without scanning the event's list.
+        self._hook_index: Dict[str, Dict[Tuple[Any, int], List[HookInfo]]] = {}
         self._error_strategy: str = "log_and_continue"
+        self._apply_error_strategy = _continue_after_error
         self._hook_tracing: bool = False
+        # Tracepoints ``(start_ns, kind, event, plugin_name, priority,
+        # elapsed_ns)`` recorded while tracing; formatted by get_trace().
+        self._trace: Optional[collections.deque] = None
+        # Wildcard patterns indexed by their literal leading segments, and
+        # how many there are, so wildcard-free registries skip the walk.
+        self._trie = _TrieNode()
+        self._wildcard_count: int = 0
+        self._seq: int = 0
+        # Resolved hooks per concrete event name, as immutable tuples, in
+        # least-recently-used order.
+        self._resolved: "collections.OrderedDict[str, Tuple[HookInfo, ...]]" = (
+            collections.OrderedDict()
+        )
+        # Generated straight-line sync dispatchers, one per concrete event
+        # name; dropped together with the resolution cache.
+        self._dispatchers: Dict[str, Callable[[Any, int], Any]] = {}
+        # Interpreted triggers per event name that has no dispatcher yet.
+        self._trigger_counts: Dict[str, int] = {}
+        # Enabled state as a bitmask: every plugin with an ``enabled`` flag
+        # owns one bit (id(plugin) -> bit), bit 0 is reserved for hooks
+        # that are always on. ``_bit_refs`` counts hooks per bit so bits can
+        # be recycled once a plugin's last hook is removed.
+        self._plugin_bits: Dict[int, int] = {}
+        self._bit_plugins: List[Optional[Any]] = [None]
+        self._bit_refs: List[int] = [0]
+        self._free_bits: List[int] = []
+        self._untracked_bits: Set[int] = set()
+        self._enabled_mask: int = 1
+        self._mask_version: int = -1
+        # Worker pool for sync hooks with a timeout, created on first use,
+        # and how many of its workers are running a hook.
+        self._timeout_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._timeout_pool_lock = threading.Lock()
+        self._timeout_busy: int = 0
 
     def register(
         self,
@@ -48,12 +423,15 @@ class HookRegistry:
         plugin: Optional[Any] = None,
         priority: int = 50,
         timeout: Optional[float] = None,
+        parallel: bool = False,
     ) -> None:
         """Register a callback to run when an event fires.
 
-        Whether ``callback`` is treated as async is auto-detected via
-        :func:`asyncio.iscoroutinefunction`. Async callbacks are skipped
-        in :meth:`trigger` with a warning; use :meth:`trigger_async`.
+        Whether ``callback`` is treated as async is taken from its
+        :func:`nitro_dispatch.hook` metadata when present, and otherwise
+        auto-detected via :func:`inspect.iscoroutinefunction`. Async
+        callbacks are skipped in :meth:`trigger` with a warning; use
+        :meth:`trigger_async`.
 
         Args:
             event_name: Event name to subscribe to. May be a literal like
@@ -68,34 +446,103 @@ class HookRegistry:
             priority: Higher values run earlier. Default 50.
             timeout: Per-hook execution limit in seconds. Exceeding
                 raises :class:`HookTimeoutError` inside dispatch.
+            parallel: Mark an async callback as independent of the chain.
+                :meth:`trigger_async` gathers consecutive parallel async
+                hooks of equal priority and awaits them concurrently; their
+                return values are ignored.
 
         Example:
             >>> reg = HookRegistry()
             >>> reg.register("user.*", lambda d: d, priority=100)
         """
-        if event_name not in self._hooks:
-            self._hooks[event_name] = []
-
-        hook_info = {
-            "callback": callback,
-            "plugin": plugin,
-            "plugin_name": plugin.name if plugin else "anonymous",
-            "priority": priority,
-            "timeout": timeout,
-            "is_async": asyncio.iscoroutinefunction(callback),
-        }
-
-        self._hooks[event_name].append(hook_info)
-
-        # Sort hooks by priority (higher priority first)
-        self._hooks[event_name].sort(key=lambda h: h["priority"], reverse=True)
+        # Interned keys let dict probes from interned trigger names succeed
+        # on the identity check alone.
+        event_name = sys.intern(event_name)
+        hook_info = self._new_hook(event_name, callback, plugin, priority, timeout, parallel)
+        _insort_by_priority(self._hooks[event_name], hook_info)
+        self._invalidate()
 
         logger.debug(
             f"Registered hook '{event_name}' from plugin "
-            f"'{hook_info['plugin_name']}' (priority={priority}, "
+            f"'{hook_info.plugin_name}' (priority={priority}, "
             f"timeout={timeout})"
         )
 
+    def register_many(
+        self,
+        entries: Iterable[Tuple[str, Callable, Optional[Any], int, Optional[float], bool]],
+    ) -> None:
+        """Register several callbacks at once.
+
+        Equivalent to calling :meth:`register` for each entry in order, but
+        every touched event list is sorted once at the end and the dispatch
+        caches are invalidated once, instead of per hook.
+
+        Args:
+            entries: ``(event_name, callback, plugin, priority, timeout,
+                parallel)`` tuples, with the same meaning as the arguments
+                of :meth:`register`.
+        """
+        touched = set()
+        for event_name, callback, plugin, priority, timeout, parallel in entries:
+            event_name = sys.intern(event_name)
+            hook_info = self._new_hook(event_name, callback, plugin, priority, timeout, parallel)
+            self._hooks[event_name].append(hook_info)
+            touched.add(event_name)
+
+        if not touched:
+            return
+        for event_name in touched:
+            self._hooks[event_name].sort(key=_hook_order)
+        self._invalidate()
+
+        logger.debug("Registered hooks for %d event(s) in one batch", len(touched))
+
+    def _new_hook(
+        self,
+        event_name: str,
+        callback: Callable,
+        plugin: Optional[Any],
+        priority: int,
+        timeout: Optional[float],
+        parallel: bool,
+    ) -> HookInfo:
+        """Build a :class:`HookInfo` and make sure ``event_name`` has a list.
+
+        ``event_name`` must already be interned. The hook is added to the
+        unregister index but not inserted; callers place it in
+        ``self._hooks[event_name]`` themselves.
+        """
+        if event_name not in self._hooks:
+            self._hooks[event_name] = []
+            self._hook_index[event_name] = {}
+            if "*" in event_name:
+                self._index_pattern(event_name)
+                self._wildcard_count += 1
+
+        # @hook already classified the callback; only undecorated callables
+        # need introspecting.
+        meta = getattr(callback, "_hook_meta", None)
+        is_async = meta[3] if meta is not None else inspect.iscoroutinefunction(callback)
+
+        hook_info = HookInfo(
+            callback,
+            plugin,
+            plugin.name if plugin else "anonymous",
+            priority,
+            timeout,
+            is_async,
+            parallel,
+            self._seq,
+            self._acquire_bit(plugin),
+            getattr(plugin, "on_error", None) if plugin is not None else None,
+        )
+        self._seq += 1
+        self._hook_index[event_name].setdefault(_unregister_key(callback, plugin), []).append(
+            hook_info
+        )
+        return hook_info
+
     def unregister(self, event_name: str, callback: Callable, plugin: Optional[Any] = None) -> bool:
         """Remove a previously registered callback from an event.
 
@@ -111,20 +558,73 @@ class HookRegistry:
         Returns:
             True if a hook was found and removed; False otherwise.
         """
-        if event_name not in self._hooks:
+        index = self._hook_index.get(event_name)
+        if not index:
+            return False
+        matches = index.pop(_unregister_key(callback, plugin), None)
+        if matches is None:
             return False
 
-        original_length = len(self._hooks[event_name])
-        self._hooks[event_name] = [
-            hook
-            for hook in self._hooks[event_name]
-            if not (hook["callback"] == callback and hook["plugin"] == plugin)
-        ]
+        # Delete in place; dispatch only ever sees the cached tuples, never
+        # this list. HookInfo compares by identity, so remove() does too.
+        hooks = self._hooks[event_name]
+        for hook in matches:
+            hooks.remove(hook)
+            self._release_bit(hook.bit)
+
+        self._invalidate()
+        logger.debug(f"Unregistered hook '{event_name}'")
+        return True
+
+    def _acquire_bit(self, plugin: Optional[Any]) -> int:
+        """Return the enabled-mask bit for a plugin, assigning one if needed."""
+        if plugin is None or not hasattr(plugin, "enabled"):
+            self._bit_refs[0] += 1
+            return 0
+
+        bit = self._plugin_bits.get(id(plugin))
+        if bit is None:
+            if self._free_bits:
+                bit = self._free_bits.pop()
+                self._bit_plugins[bit] = plugin
+            else:
+                bit = len(self._bit_plugins)
+                self._bit_plugins.append(plugin)
+                self._bit_refs.append(0)
+            self._plugin_bits[id(plugin)] = bit
+            if getattr(type(plugin), "enabled", None) is not _TRACKED_ENABLED:
+                self._untracked_bits.add(bit)
+            self._mask_version = -1
+        self._bit_refs[bit] += 1
+        return bit
+
+    def _release_bit(self, bit: int) -> None:
+        """Drop one hook's reference to a bit, recycling it when unused."""
+        self._bit_refs[bit] -= 1
+        if bit and not self._bit_refs[bit]:
+            del self._plugin_bits[id(self._bit_plugins[bit])]
+            self._bit_plugins[bit] = None
+            self._untracked_bits.discard(bit)
+            self._free_bits.append(bit)
+            self._mask_version = -1
+
+    def _get_enabled_mask(self) -> int:
+        """Return the enabled-plugin bitmask, rebuilding it if stale.
+
+        Rebuilt only after some plugin's ``enabled`` flag was assigned,
+        unless an untracked plugin is registered, in which case it is
+        re-read on every call.
+        """
+        if self._mask_version == PluginBase._state_version and not self._untracked_bits:
+            return self._enabled_mask
 
-        removed = len(self._hooks[event_name]) < original_length
-        if removed:
-            logger.debug(f"Unregistered hook '{event_name}'")
-        return removed
+        mask = 1
+        for bit, plugin in enumerate(self._bit_plugins):
+            if plugin is not None and plugin.enabled:
+                mask |= 1 << bit
+        self._enabled_mask = mask
+        self._mask_version = PluginBase._state_version
+        return mask
 
     def _match_event_pattern(self, pattern: str, event: str) -> bool:
         """
@@ -137,12 +637,99 @@ class HookRegistry:
         Returns:
             True if event matches pattern
         """
-        # Convert wildcard pattern to regex
-        regex_pattern = pattern.replace(".", r"\.").replace("*", ".*")
-        regex_pattern = f"^{regex_pattern}$"
-        return bool(re.match(regex_pattern, event))
+        return _pattern_regex(pattern).match(event) is not None
+
+    def _index_pattern(self, pattern: str) -> None:
+        """Insert a wildcard pattern into the segment trie."""
+        segments = [sys.intern(segment) for segment in pattern.split(".")]
+        node = self._trie
+        for index, segment in enumerate(segments):
+            if "*" in segment:
+                remainder = ".".join(segments[index:])
+                node.wildcards[remainder] = (pattern, _compile_wildcard(remainder))
+                node.prefilter = None
+                return
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TrieNode()
+            node = child
+
+    def _unindex_pattern(self, pattern: str) -> None:
+        """Remove a wildcard pattern from the segment trie, pruning empty nodes."""
+        segments = pattern.split(".")
+        path = []
+        node = self._trie
+        for index, segment in enumerate(segments):
+            if "*" in segment:
+                node.wildcards.pop(".".join(segments[index:]), None)
+                node.prefilter = None
+                break
+            child = node.children.get(segment)
+            if child is None:
+                return
+            path.append((node, segment))
+            node = child
+
+        for parent, segment in reversed(path):
+            child = parent.children[segment]
+            if child.children or child.wildcards:
+                break
+            del parent.children[segment]
+
+    def _match_wildcards(self, event_name: str) -> List[str]:
+        """Return registered wildcard patterns that match a concrete event.
+
+        Walks the trie one segment at a time. At every node reached, the
+        node's wildcard remainders are tested against the unconsumed part of
+        the event name, so only patterns sharing the event's literal prefix
+        are ever evaluated. Nodes holding many remainders first try one
+        combined regex and skip their patterns when it doesn't match.
+        """
+        matched = []
+        segments = event_name.split(".")
+        node = self._trie
+        for depth in range(len(segments)):
+            wildcards = node.wildcards
+            if wildcards:
+                remainder = ".".join(segments[depth:])
+                candidates: Iterable[Tuple[str, Callable[[str], Any]]] = wildcards.values()
+                if len(wildcards) >= _PREFILTER_MIN:
+                    if node.prefilter is None:
+                        node.prefilter = _compile_prefilter(wildcards)
+                    if not node.prefilter(remainder):
+                        candidates = ()
+                for pattern, matcher in candidates:
+                    if pattern != event_name and matcher(remainder):
+                        matched.append(pattern)
+            node = node.children.get(segments[depth])
+            if node is None:
+                break
+        return matched
 
-    def _get_matching_hooks(self, event_name: str) -> List[Dict[str, Any]]:
+    def _resolve_hooks(self, event_name: str) -> List[HookInfo]:
+        """Build the priority-ordered hook list for a concrete event name.
+
+        Results are memoized by :meth:`_get_matching_hooks`; any mutation
+        of the registry clears that cache.
+        """
+        exact = self._hooks.get(event_name, [])
+        if not self._wildcard_count:
+            return list(exact)
+        patterns = self._match_wildcards(event_name)
+        if not patterns:
+            return list(exact)
+
+        # Every per-event list is already in _hook_order from registration,
+        # so a k-way merge is enough; no full re-sort.
+        return list(heapq.merge(exact, *(self._hooks[p] for p in patterns), key=_hook_order))
+
+    def _invalidate(self) -> None:
+        """Drop cached resolutions and dispatchers after a registry change."""
+        self._resolved.clear()
+        self._dispatchers.clear()
+        self._trigger_counts.clear()
+
+    def _get_matching_hooks(self, event_name: str) -> Tuple[HookInfo, ...]:
         """
         Get all hooks that match the event name (including wildcards).
 
@@ -150,23 +737,21 @@ class HookRegistry:
             event_name: Event name to match
 
         Returns:
-            List of matching hook information dictionaries
+            Tuple of matching hook information dictionaries, shared with
+            the resolution cache. Distinct event names are usually few, so
+            after the first trigger this is a single dict probe. When more
+            than ``_RESOLVE_CACHE_SIZE`` names are seen, the least recently
+            triggered one is evicted, so hot events stay cached.
         """
-        matching_hooks = []
-
-        for registered_event, hooks in self._hooks.items():
-            # Exact match
-            if registered_event == event_name:
-                matching_hooks.extend(hooks)
-            # Wildcard match
-            elif "*" in registered_event:
-                if self._match_event_pattern(registered_event, event_name):
-                    matching_hooks.extend(hooks)
-
-        # Sort by priority (higher first)
-        matching_hooks.sort(key=lambda h: h["priority"], reverse=True)
-
-        return matching_hooks
+        resolved = self._resolved
+        hooks = resolved.get(event_name)
+        if hooks is None:
+            hooks = resolved[event_name] = tuple(self._resolve_hooks(event_name))
+            if len(resolved) > _RESOLVE_CACHE_SIZE:
+                resolved.popitem(last=False)
+        else:
+            resolved.move_to_end(event_name)
+        return hooks
 
     def _execute_hook_with_timeout(
         self, callback: Callable, data: Any, timeout: Optional[float]
@@ -183,7 +768,8 @@ class HookRegistry:
             Result from callback
 
         Raises:
-            HookTimeoutError: If execution exceeds timeout
+            HookTimeoutError: If execution exceeds timeout, or no timed-hook
+                worker is free to start it
         """
         if timeout is None:
             return callback(data)
@@ -191,15 +777,60 @@ class HookRegistry:
         # Thread-based timeout: portable (works on Windows and in non-main
         # threads, unlike signal.SIGALRM) and safe to call from executors.
         # Note: the worker thread cannot be forcibly killed on timeout — this
-        # matches asyncio.wait_for's behavior for async hooks.
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(callback, data)
-            try:
-                return future.result(timeout=timeout)
-            except concurrent.futures.TimeoutError:
-                raise HookTimeoutError(
-                    f"Hook execution exceeded timeout of {timeout}s"
+        # matches asyncio.wait_for's behavior for async hooks. A timed-out
+        # hook keeps its pool worker busy until it returns.
+        future = self._submit_timed(callback, data)
+        if future is None:
+            raise HookTimeoutError(
+                f"Hook not run: all {_TIMEOUT_POOL_SIZE} timed-hook workers are still busy"
+            )
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            # Only succeeds if the hook never started; then it never will.
+            future.cancel()
+            raise HookTimeoutError(f"Hook execution exceeded timeout of {timeout}s")
+
+    def _submit_timed(self, callback: Callable, data: Any) -> Optional[concurrent.futures.Future]:
+        """Start a timed sync hook on an idle pool worker, so its timeout covers only its run.
+
+        The pool is created lazily. Returns ``None`` without running the
+        hook when every worker is still busy (hooks stuck past their
+        timeout), rather than queueing it on the clock or spawning threads.
+        """
+        with self._timeout_pool_lock:
+            if self._timeout_busy >= _TIMEOUT_POOL_SIZE:
+                return None
+            self._timeout_busy += 1
+            if self._timeout_pool is None:
+                self._timeout_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_TIMEOUT_POOL_SIZE, thread_name_prefix="nitro-hook"
                 )
+            future = self._timeout_pool.submit(callback, data)
+        # Outside the lock: an already finished future runs the callback
+        # right here, and it takes the lock itself.
+        future.add_done_callback(self._release_timeout_worker)
+        return future
+
+    def _release_timeout_worker(self, future: concurrent.futures.Future) -> None:
+        """Done callback marking a pool worker idle again (also runs on cancel)."""
+        with self._timeout_pool_lock:
+            self._timeout_busy -= 1
+
+    def close(self) -> None:
+        """Shut down the worker pool used for timed sync hooks.
+
+        Idle workers exit immediately; a hook still running past its
+        timeout finishes on its thread without being waited for. The pool
+        is recreated on the next timed hook, so the registry stays usable.
+        An ``executor`` passed to the constructor is owned by the caller
+        and is left running.
+        """
+        with self._timeout_pool_lock:
+            pool, self._timeout_pool = self._timeout_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+            logger.debug("Shut down timed-hook worker pool")
 
     async def _execute_async_hook_with_timeout(
         self, callback: Callable, data: Any, timeout: Optional[float]
@@ -221,18 +852,88 @@ class HookRegistry:
         if timeout is None:
             return await callback(data)
 
+        if _async_timeout is None:
+            try:
+                return await asyncio.wait_for(callback(data), timeout=timeout)
+            except asyncio.TimeoutError:
+                raise HookTimeoutError(f"Async hook execution exceeded timeout of {timeout}s")
+
+        # asyncio.timeout (3.11+) arms a deadline on the current task instead
+        # of wrapping the coroutine in a new Task as wait_for does.
+        scope = _async_timeout(timeout)
         try:
-            return await asyncio.wait_for(callback(data), timeout=timeout)
-        except asyncio.TimeoutError:
-            raise HookTimeoutError(f"Async hook execution exceeded timeout of {timeout}s")
+            async with scope:
+                return await callback(data)
+        except TimeoutError:
+            if scope.expired():
+                raise HookTimeoutError(f"Async hook execution exceeded timeout of {timeout}s")
+            raise
+
+    def _handle_hook_error(
+        self,
+        hook_info: HookInfo,
+        error: Exception,
+        event_name: str,
+        errors: Optional[List[Dict[str, Any]]],
+        kind: str,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Apply the error strategy to an exception raised by a hook.
+
+        Timeouts and ordinary exceptions share one ``except`` clause in the
+        dispatch loops; only the log message tells them apart.
+
+        Args:
+            hook_info: Hook that raised
+            error: The raised exception
+            event_name: Event being dispatched
+            errors: Per-dispatch list collecting errors under ``collect_all``,
+                or ``None`` if nothing has been collected yet
+            kind: ``"hook"`` or ``"async hook"``, used in the log message
+
+        Returns:
+            The errors list to carry forward, allocated on first use so
+            error-free dispatches never build one
+
+        Raises:
+            HookError: If the error strategy is ``fail_fast``
+        """
+        plugin_name = hook_info.plugin_name
+
+        # %-style template and args: the message is only formatted if a
+        # handler emits it, or if fail_fast needs it for the HookError.
+        if isinstance(error, HookTimeoutError):
+            message = (
+                "%s '%s' from plugin '%s' timed out: %s",
+                (kind.capitalize(), event_name, plugin_name, error),
+            )
+        else:
+            message = (
+                "Error executing %s '%s' from plugin '%s': %s",
+                (kind, event_name, plugin_name, error),
+            )
+        logger.error(message[0], *message[1])
+
+        # Notify plugin of error
+        on_error = hook_info.on_error
+        if on_error is not None:
+            try:
+                on_error(error)
+            except Exception as notify_error:
+                logger.error("Error in plugin error handler: %s", notify_error)
+
+        return self._apply_error_strategy(message, error, plugin_name, event_name, errors)
 
     def trigger(self, event_name: str, data: Any = None) -> Any:
         """Fire an event and run matching hooks synchronously.
 
         Hooks run in priority order (highest first). Each hook's
         non-``None`` return value becomes the ``data`` input of the next
-        hook. A hook raising :class:`StopPropagation` halts the chain
-        and the current ``data`` is returned immediately. Async hooks
+        hook. ``data`` is passed by reference and never copied, so hooks
+        may mutate it in place; callers that need the original intact
+        should pass a copy. A hook returning the :class:`StopPropagation`
+        class (cheapest) or raising it halts the chain and the current
+        ``data`` is returned immediately. Async hooks
         are skipped with a warning — use :meth:`trigger_async` for
         those.
 
@@ -254,123 +955,429 @@ class HookRegistry:
             >>> reg.trigger("sum", 41)
             42
         """
+        if not self._wildcard_count and event_name not in self._hooks:
+            # Nothing can match: skip interning and the resolution cache.
+            logger.debug("No hooks registered for event '%s'", event_name)
+            return data
+
+        event_name = sys.intern(event_name)
         hooks = self._get_matching_hooks(event_name)
 
         if not hooks:
-            logger.debug(f"No hooks registered for event '{event_name}'")
+            logger.debug("No hooks registered for event '%s'", event_name)
             return data
 
         if self._hook_tracing:
-            logger.debug(f"Triggering event '{event_name}' with {len(hooks)} hooks")
+            logger.debug("Triggering event '%s' with %d hooks", event_name, len(hooks))
+            return self._run_hooks(event_name, hooks, data)
+
+        dispatcher = self._dispatchers.get(event_name)
+        if dispatcher is None:
+            # A lone sync hook gets its closure dispatcher straight away; it
+            # costs no more to build than one interpreted run.
+            if len(hooks) != 1 or hooks[0].is_async:
+                count = self._trigger_counts.get(event_name, 0) + 1
+                if count < _COMPILE_THRESHOLD:
+                    if len(self._trigger_counts) >= _DISPATCHER_CACHE_SIZE:
+                        self._trigger_counts.clear()
+                    self._trigger_counts[event_name] = count
+                    return self._run_hooks(event_name, hooks, data)
+                self._trigger_counts.pop(event_name, None)
+            dispatcher = self._get_dispatcher(event_name, hooks)
+        return dispatcher(data, self._get_enabled_mask())
+
+    def trigger_batch(self, event_name: str, payloads: Iterable[Any]) -> List[Any]:
+        """Fire the same event once per payload, resolving its hooks only once.
+
+        Equivalent to ``[self.trigger(event_name, p) for p in payloads]``
+        but wildcard resolution and dispatcher lookup happen once for the
+        whole batch, which pays off for high-rate emitters such as
+        metrics or log lines. Each payload runs through the full chain
+        independently; :class:`StopPropagation` only ends that payload's
+        chain. Plugins enabled or disabled mid-batch take effect from the
+        next payload.
 
-        errors = []
+        Args:
+            event_name: Event name to fire.
+            payloads: Payloads to dispatch, in order.
+
+        Returns:
+            The resulting payload for each input, in input order.
+
+        Raises:
+            HookError: If the error strategy is ``"fail_fast"`` and a
+                hook raises; payloads after the failing one are not run.
+        """
+        if not self._wildcard_count and event_name not in self._hooks:
+            # Nothing can match: skip interning and the resolution cache.
+            logger.debug("No hooks registered for event '%s'", event_name)
+            return list(payloads)
+
+        event_name = sys.intern(event_name)
+        hooks = self._get_matching_hooks(event_name)
+
+        if not hooks:
+            logger.debug("No hooks registered for event '%s'", event_name)
+            return list(payloads)
+
+        if self._hook_tracing:
+            logger.debug("Triggering event '%s' in batch with %d hooks", event_name, len(hooks))
+            return [self._run_hooks(event_name, hooks, data) for data in payloads]
+
+        dispatcher = self._get_dispatcher(event_name, hooks)
+        get_mask = self._get_enabled_mask
+        return [dispatcher(data, get_mask()) for data in payloads]
+
+    def _get_dispatcher(self, event_name: str, hooks: Sequence[HookInfo]) -> Callable:
+        """Return the cached dispatcher for ``event_name``, compiling it on first use."""
+        dispatcher = self._dispatchers.get(event_name)
+        if dispatcher is None:
+            if len(self._dispatchers) >= _DISPATCHER_CACHE_SIZE:
+                self._dispatchers.clear()
+            if len(hooks) == 1 and not hooks[0].is_async:
+                dispatcher = self._single_dispatcher(event_name, hooks[0])
+            else:
+                dispatcher = self._compile_dispatcher(event_name, hooks)
+            self._dispatchers[event_name] = dispatcher
+        return dispatcher
+
+    def _single_dispatcher(self, event_name: str, hook_info: HookInfo) -> Callable[[Any, int], Any]:
+        """
+        Build the dispatcher for an event with exactly one sync hook.
+
+        A plain closure over the hook: no loop, no error list unless the
+        hook fails, and no code generation. Must behave exactly like
+        :meth:`_run_hooks` for a one-hook list.
+
+        Args:
+            event_name: Event the hook was resolved for
+            hook_info: The event's only hook; must not be async
+
+        Returns:
+            ``dispatch(data, enabled_mask) -> result``
+        """
+        callback = hook_info.callback
+        timeout = hook_info.timeout
+        bit = hook_info.bit
+        plugin_name = hook_info.plugin_name
+        execute = self._execute_hook_with_timeout
+
+        def dispatch(result: Any, mask: int) -> Any:
+            if not mask >> bit & 1:
+                logger.debug("Skipping hook from disabled plugin '%s'", plugin_name)
+                return result
+            try:
+                if timeout is None:
+                    new_result = callback(result)
+                else:
+                    new_result = execute(callback, result, timeout)
+            except StopPropagation as e:
+                logger.info(
+                    "Hook propagation stopped by '%s' for event '%s': %s",
+                    plugin_name,
+                    event_name,
+                    e,
+                )
+                return result
+            except Exception as e:
+                errors = self._handle_hook_error(hook_info, e, event_name, None, "hook")
+                if errors:
+                    self._finish_trigger(event_name, errors)
+                return result
+            if new_result is None:
+                return result
+            if new_result is StopPropagation:
+                logger.info(
+                    "Hook propagation stopped by '%s' for event '%s'", plugin_name, event_name
+                )
+                return result
+            return new_result
+
+        return dispatch
+
+    def _run_hooks(self, event_name: str, hooks: Sequence[HookInfo], data: Any) -> Any:
+        """
+        Run a resolved hook list with the generic interpreted loop.
+
+        Used while tracing is on and for events not yet triggered often
+        enough to earn a generated dispatcher; otherwise :meth:`trigger`
+        runs the dispatcher, which must stay behaviourally identical.
+
+        Args:
+            event_name: Event being dispatched
+            hooks: Resolved hooks in priority order
+            data: Payload threaded through the chain
+
+        Returns:
+            The payload after the last hook returned
+        """
+        errors = None
         result = data
+        enabled_mask = self._get_enabled_mask()
+        # Hoisted once per dispatch: tracing and the executor are read
+        # for every hook otherwise.
+        tracing = self._hook_tracing
+        trace = self._trace
+        execute = self._execute_hook_with_timeout
+        log_debug = logger.debug
 
         for hook_info in hooks:
-            callback = hook_info["callback"]
-            plugin = hook_info["plugin"]
-            plugin_name = hook_info["plugin_name"]
-            priority = hook_info["priority"]
-            timeout = hook_info["timeout"]
-            is_async = hook_info["is_async"]
+            callback = hook_info.callback
+            plugin_name = hook_info.plugin_name
+            priority = hook_info.priority
+            timeout = hook_info.timeout
+            is_async = hook_info.is_async
 
             # Skip disabled plugins
-            if plugin and hasattr(plugin, "enabled") and not plugin.enabled:
-                logger.debug(f"Skipping hook from disabled plugin '{plugin_name}'")
+            if not enabled_mask >> hook_info.bit & 1:
+                log_debug("Skipping hook from disabled plugin '%s'", plugin_name)
                 continue
 
             # Can't execute async hooks in sync context
             if is_async:
                 logger.warning(
-                    f"Skipping async hook '{plugin_name}' in sync trigger. "
-                    f"Use trigger_async() instead."
+                    "Skipping async hook '%s' in sync trigger. Use trigger_async() instead.",
+                    plugin_name,
                 )
                 continue
 
             try:
-                import time
-
-                start_time = time.time() if self._hook_tracing else None
+                start_time = perf_counter_ns() if tracing else 0
 
                 # Execute hook with timeout
-                new_result = self._execute_hook_with_timeout(callback, result, timeout)
-
-                if self._hook_tracing:
-                    elapsed = time.time() - start_time
-                    logger.debug(
-                        f"Hook '{event_name}' from '{plugin_name}' "
-                        f"(priority={priority}) executed in {elapsed:.4f}s"
+                new_result = execute(callback, result, timeout)
+
+                if tracing:
+                    trace.append(
+                        (
+                            start_time,
+                            "Hook",
+                            event_name,
+                            plugin_name,
+                            priority,
+                            perf_counter_ns() - start_time,
+                        )
                     )
 
                 # Only update result if callback returned something
                 if new_result is not None:
+                    if new_result is StopPropagation:
+                        logger.info(
+                            "Hook propagation stopped by '%s' for event '%s'",
+                            plugin_name,
+                            event_name,
+                        )
+                        break
                     result = new_result
 
             except StopPropagation as e:
                 logger.info(
-                    f"Hook propagation stopped by '{plugin_name}' " f"for event '{event_name}': {e}"
+                    "Hook propagation stopped by '%s' for event '%s': %s",
+                    plugin_name,
+                    event_name,
+                    e,
                 )
                 break
 
-            except HookTimeoutError as e:
-                error_msg = f"Hook '{event_name}' from plugin '{plugin_name}' " f"timed out: {e}"
-                logger.error(error_msg)
-
-                if plugin and hasattr(plugin, "on_error"):
-                    try:
-                        plugin.on_error(e)
-                    except Exception as notify_error:
-                        logger.error(f"Error in plugin error handler: {notify_error}")
-
-                if self._error_strategy == "fail_fast":
-                    raise HookError(error_msg) from e
-                elif self._error_strategy == "collect_all":
-                    errors.append(
-                        {
-                            "plugin": plugin_name,
-                            "error": e,
-                            "event": event_name,
-                        }
-                    )
-
             except Exception as e:
-                error_msg = (
-                    f"Error executing hook '{event_name}' from plugin " f"'{plugin_name}': {e}"
-                )
-                logger.error(error_msg)
-
-                # Notify plugin of error
-                if plugin and hasattr(plugin, "on_error"):
-                    try:
-                        plugin.on_error(e)
-                    except Exception as notify_error:
-                        logger.error(f"Error in plugin error handler: {notify_error}")
-
-                if self._error_strategy == "fail_fast":
-                    raise HookError(error_msg) from e
-                elif self._error_strategy == "collect_all":
-                    errors.append(
-                        {
-                            "plugin": plugin_name,
-                            "error": e,
-                            "event": event_name,
-                        }
-                    )
-                # log_and_continue: just continue to next hook
+                errors = self._handle_hook_error(hook_info, e, event_name, errors, "hook")
 
-        if errors and self._error_strategy == "collect_all":
-            logger.warning(f"Event '{event_name}' completed with {len(errors)} errors")
+        if errors:
+            self._finish_trigger(event_name, errors)
 
         return result
 
+    def _compile_dispatcher(
+        self, event_name: str, hooks: Sequence[HookInfo]
+    ) -> Callable[[Any, int], Any]:
+        """
+        Generate a straight-line sync dispatcher for a resolved hook list.
+
+        The hook list is fixed until the next registry change, so each hook
+        becomes an unrolled block of code with its callback, timeout and
+        messages bound as constants. Hooks that are always enabled (bit 0)
+        skip the mask test entirely. Error strategy and the enabled mask
+        are still read at call time.
+
+        Args:
+            event_name: Event the hooks were resolved for
+            hooks: Resolved hooks in priority order
+
+        Returns:
+            ``dispatch(data, enabled_mask) -> result``
+        """
+        namespace: Dict[str, Any] = {
+            "self": self,
+            "logger": logger,
+            "StopPropagation": StopPropagation,
+            "event_name": event_name,
+        }
+        lines = ["def dispatch(result, mask):", "    errors = None"]
+
+        for index, hook_info in enumerate(hooks):
+            plugin_name = hook_info.plugin_name
+            bit = hook_info.bit
+            namespace[f"h{index}"] = hook_info
+            namespace[f"c{index}"] = hook_info.callback
+
+            indent = "    "
+            if bit:
+                lines.append(f"    if mask >> {bit} & 1:")
+                indent = "        "
+
+            if hook_info.is_async:
+                namespace[f"w{index}"] = (
+                    f"Skipping async hook '{plugin_name}' in sync trigger. "
+                    f"Use trigger_async() instead."
+                )
+                lines.append(f"{indent}logger.warning(w{index})")
+            else:
+                if hook_info.timeout is None:
+                    call = f"c{index}(result)"
+                else:
+                    namespace[f"t{index}"] = hook_info.timeout
+                    call = f"self._execute_hook_with_timeout(c{index}, result, t{index})"
+                namespace[f"s{index}"] = (
+                    f"Hook propagation stopped by '{plugin_name}' for event '{event_name}'"
+                )
+                lines += [
+                    f"{indent}try:",
+                    f"{indent}    new_result = {call}",
+                    f"{indent}    if new_result is not None:",
+                    f"{indent}        if new_result is StopPropagation:",
+                    f"{indent}            logger.info(s{index})",
+                    f"{indent}            if errors:",
+                    f"{indent}                self._finish_trigger(event_name, errors)",
+                    f"{indent}            return result",
+                    f"{indent}        result = new_result",
+                    f"{indent}except StopPropagation as e:",
+                    f"{indent}    logger.info('%s: %s', s{index}, e)",
+                    f"{indent}    if errors:",
+                    f"{indent}        self._finish_trigger(event_name, errors)",
+                    f"{indent}    return result",
+                    f"{indent}except Exception as e:",
+                    f"{indent}    errors = self._handle_hook_error(",
+                    f'{indent}        h{index}, e, event_name, errors, "hook"',
+                    f"{indent}    )",
+                ]
+
+            if bit:
+                namespace[f"d{index}"] = f"Skipping hook from disabled plugin '{plugin_name}'"
+                lines += ["    else:", f"        logger.debug(d{index})"]
+
+        lines += [
+            "    if errors:",
+            "        self._finish_trigger(event_name, errors)",
+            "    return result",
+        ]
+
+        source = "\n".join(lines) + "\n"
+        exec(compile(source, f"<nitro_dispatch {event_name}>", "exec"), namespace)
+        return namespace["dispatch"]
+
+    def _finish_trigger(self, event_name: str, errors: List[Dict[str, Any]]) -> None:
+        """Log the collect_all summary for a sync dispatch that hit errors."""
+        if self._error_strategy == "collect_all":
+            logger.warning("Event '%s' completed with %d errors", event_name, len(errors))
+
+    async def _run_parallel_group(
+        self,
+        group: List[HookInfo],
+        event_name: str,
+        data: Any,
+        errors: Optional[List[Dict[str, Any]]],
+    ) -> Tuple[bool, Optional[List[Dict[str, Any]]]]:
+        """
+        Await a tier of parallel async hooks concurrently on the same data.
+
+        Outcomes are processed in priority order once every hook has
+        finished, so error handling matches a sequential run. Return values
+        are discarded, except that returning :class:`StopPropagation` stops
+        the chain like raising it.
+
+        Args:
+            group: Enabled parallel async hooks sharing one priority
+            event_name: Event being dispatched
+            data: Payload passed to every hook in the group
+            errors: Per-dispatch list collecting errors under ``collect_all``,
+                or ``None``
+
+        Returns:
+            ``(stopped, errors)``: whether any hook in the group raised or
+            returned :class:`StopPropagation`, and the errors list to carry
+            forward
+
+        Raises:
+            HookError: If the error strategy is ``fail_fast`` and a hook raised
+        """
+        start_time = perf_counter_ns() if self._hook_tracing else 0
+
+        outcomes = await asyncio.gather(
+            *(
+                self._execute_async_hook_with_timeout(hook_info.callback, data, hook_info.timeout)
+                for hook_info in group
+            ),
+            return_exceptions=True,
+        )
+
+        if self._hook_tracing:
+            elapsed = perf_counter_ns() - start_time
+            for hook_info in group:
+                self._trace.append(
+                    (
+                        start_time,
+                        "Parallel async hook",
+                        event_name,
+                        hook_info.plugin_name,
+                        hook_info.priority,
+                        elapsed,
+                    )
+                )
+
+        stopped = False
+        for hook_info, outcome in zip(group, outcomes):
+            if isinstance(outcome, StopPropagation):
+                logger.info(
+                    "Hook propagation stopped by '%s' for event '%s': %s",
+                    hook_info.plugin_name,
+                    event_name,
+                    outcome,
+                )
+                stopped = True
+            elif outcome is StopPropagation:
+                logger.info(
+                    "Hook propagation stopped by '%s' for event '%s'",
+                    hook_info.plugin_name,
+                    event_name,
+                )
+                stopped = True
+            elif isinstance(outcome, Exception):
+                errors = self._handle_hook_error(
+                    hook_info, outcome, event_name, errors, "async hook"
+                )
+            elif isinstance(outcome, BaseException):
+                raise outcome
+        return stopped, errors
+
     async def trigger_async(self, event_name: str, data: Any = None) -> Any:
         """Fire an event asynchronously, running matching hooks.
 
-        Async hooks run natively via ``asyncio.wait_for``. Sync hooks
-        are dispatched to the default executor so they do not block
+        Async hooks run natively on the event loop, with per-hook
+        timeouts enforced by ``asyncio.timeout``. Sync hooks
+        are dispatched to the executor passed to the constructor
+        (by default the loop's default executor) so they do not block
         the event loop — which means sync hooks must be thread-safe
-        when invoked through this method. Ordering, stop-propagation,
-        and error-strategy semantics are identical to :meth:`trigger`.
+        when invoked through this method — unless the registry was
+        created with ``inline_sync_hooks=True``, in which case those
+        without a timeout are called directly on the loop thread.
+        Ordering, stop-propagation, and error-strategy semantics are
+        identical to :meth:`trigger`.
+
+        Consecutive async hooks registered with ``parallel=True`` at the
+        same priority are awaited together with :func:`asyncio.gather`,
+        so independent I/O overlaps instead of adding up. They all see
+        the same input, their return values are ignored, and errors or
+        :class:`StopPropagation` are applied in priority order afterwards.
 
         Args:
             event_name: Event name to fire.
@@ -391,122 +1398,190 @@ class HookRegistry:
             >>> asyncio.run(reg.trigger_async("sum", 41))
             42
         """
+        if not self._wildcard_count and event_name not in self._hooks:
+            # Nothing can match: skip interning and the resolution cache.
+            logger.debug("No hooks registered for event '%s'", event_name)
+            return data
+
+        event_name = sys.intern(event_name)
         hooks = self._get_matching_hooks(event_name)
 
         if not hooks:
-            logger.debug(f"No hooks registered for event '{event_name}'")
+            logger.debug("No hooks registered for event '%s'", event_name)
             return data
 
         if self._hook_tracing:
-            logger.debug(f"Triggering async event '{event_name}' with " f"{len(hooks)} hooks")
+            logger.debug("Triggering async event '%s' with %d hooks", event_name, len(hooks))
 
-        errors = []
-        result = data
+        return await self._run_hooks_async(event_name, hooks, data, asyncio.get_running_loop())
 
-        for hook_info in hooks:
-            callback = hook_info["callback"]
-            plugin = hook_info["plugin"]
-            plugin_name = hook_info["plugin_name"]
-            priority = hook_info["priority"]
-            timeout = hook_info["timeout"]
-            is_async = hook_info["is_async"]
+    async def trigger_batch_async(self, event_name: str, payloads: Iterable[Any]) -> List[Any]:
+        """Async counterpart of :meth:`trigger_batch`.
+
+        Hooks are resolved once for the whole batch and each payload is
+        then run through the chain in turn, with the same semantics as
+        :meth:`trigger_async`. Payloads are processed sequentially so
+        hook ordering guarantees hold across the batch.
+
+        Args:
+            event_name: Event name to fire.
+            payloads: Payloads to dispatch, in order.
+
+        Returns:
+            The resulting payload for each input, in input order.
+
+        Raises:
+            HookError: If the error strategy is ``"fail_fast"`` and a
+                hook raises; payloads after the failing one are not run.
+        """
+        if not self._wildcard_count and event_name not in self._hooks:
+            # Nothing can match: skip interning and the resolution cache.
+            logger.debug("No hooks registered for event '%s'", event_name)
+            return list(payloads)
+
+        event_name = sys.intern(event_name)
+        hooks = self._get_matching_hooks(event_name)
+
+        if not hooks:
+            logger.debug("No hooks registered for event '%s'", event_name)
+            return list(payloads)
+
+        if self._hook_tracing:
+            logger.debug(
+                "Triggering async event '%s' in batch with %d hooks", event_name, len(hooks)
+            )
+
+        loop = asyncio.get_running_loop()
+        return [await self._run_hooks_async(event_name, hooks, data, loop) for data in payloads]
+
+    async def _run_hooks_async(
+        self,
+        event_name: str,
+        hooks: Sequence[HookInfo],
+        data: Any,
+        loop: asyncio.AbstractEventLoop,
+    ) -> Any:
+        """Run ``hooks`` over ``data`` on ``loop`` for :meth:`trigger_async`."""
+        errors = None
+        result = data
+        enabled_mask = self._get_enabled_mask()
+        # Hoisted once per dispatch, as in _run_hooks.
+        tracing = self._hook_tracing
+        trace = self._trace
+        inline_sync = self._inline_sync_hooks
+        executor = self._executor
+        execute = self._execute_hook_with_timeout
+        execute_async = self._execute_async_hook_with_timeout
+        log_debug = logger.debug
+        index = 0
+        count = len(hooks)
+
+        while index < count:
+            hook_info = hooks[index]
+            index += 1
+            callback = hook_info.callback
+            plugin_name = hook_info.plugin_name
+            priority = hook_info.priority
+            timeout = hook_info.timeout
+            is_async = hook_info.is_async
 
             # Skip disabled plugins
-            if plugin and hasattr(plugin, "enabled") and not plugin.enabled:
-                logger.debug(f"Skipping hook from disabled plugin '{plugin_name}'")
+            if not enabled_mask >> hook_info.bit & 1:
+                log_debug("Skipping hook from disabled plugin '%s'", plugin_name)
                 continue
 
-            try:
-                import time
+            if is_async and hook_info.parallel:
+                # Absorb the rest of this priority tier's parallel async hooks
+                # and await them all at once.
+                group = [hook_info]
+                while index < count:
+                    candidate = hooks[index]
+                    if not (
+                        candidate.priority == priority and candidate.parallel and candidate.is_async
+                    ):
+                        break
+                    index += 1
+                    if not enabled_mask >> candidate.bit & 1:
+                        log_debug("Skipping hook from disabled plugin '%s'", candidate.plugin_name)
+                        continue
+                    group.append(candidate)
+
+                stopped, errors = await self._run_parallel_group(group, event_name, result, errors)
+                if stopped:
+                    break
+                continue
 
-                start_time = time.time() if self._hook_tracing else None
+            try:
+                start_time = perf_counter_ns() if tracing else 0
 
                 # Execute hook (async or sync)
                 if is_async:
-                    new_result = await self._execute_async_hook_with_timeout(
-                        callback, result, timeout
-                    )
+                    new_result = await execute_async(callback, result, timeout)
+                elif timeout is None and inline_sync:
+                    new_result = callback(result)
                 else:
                     # Run sync hook in executor to avoid blocking
-                    loop = asyncio.get_event_loop()
                     new_result = await loop.run_in_executor(
-                        None,
-                        self._execute_hook_with_timeout,
-                        callback,
-                        result,
-                        timeout,
+                        executor, execute, callback, result, timeout
                     )
 
-                if self._hook_tracing:
-                    elapsed = time.time() - start_time
-                    logger.debug(
-                        f"Async hook '{event_name}' from '{plugin_name}' "
-                        f"(priority={priority}) executed in {elapsed:.4f}s"
+                if tracing:
+                    trace.append(
+                        (
+                            start_time,
+                            "Async hook",
+                            event_name,
+                            plugin_name,
+                            priority,
+                            perf_counter_ns() - start_time,
+                        )
                     )
 
                 # Only update result if callback returned something
                 if new_result is not None:
+                    if new_result is StopPropagation:
+                        logger.info(
+                            "Hook propagation stopped by '%s' for event '%s'",
+                            plugin_name,
+                            event_name,
+                        )
+                        break
                     result = new_result
 
             except StopPropagation as e:
                 logger.info(
-                    f"Hook propagation stopped by '{plugin_name}' " f"for event '{event_name}': {e}"
+                    "Hook propagation stopped by '%s' for event '%s': %s",
+                    plugin_name,
+                    event_name,
+                    e,
                 )
                 break
 
-            except HookTimeoutError as e:
-                error_msg = (
-                    f"Async hook '{event_name}' from plugin '{plugin_name}' " f"timed out: {e}"
-                )
-                logger.error(error_msg)
-
-                if plugin and hasattr(plugin, "on_error"):
-                    try:
-                        plugin.on_error(e)
-                    except Exception as notify_error:
-                        logger.error(f"Error in plugin error handler: {notify_error}")
-
-                if self._error_strategy == "fail_fast":
-                    raise HookError(error_msg) from e
-                elif self._error_strategy == "collect_all":
-                    errors.append(
-                        {
-                            "plugin": plugin_name,
-                            "error": e,
-                            "event": event_name,
-                        }
-                    )
-
             except Exception as e:
-                error_msg = (
-                    f"Error executing async hook '{event_name}' from plugin "
-                    f"'{plugin_name}': {e}"
-                )
-                logger.error(error_msg)
-
-                if plugin and hasattr(plugin, "on_error"):
-                    try:
-                        plugin.on_error(e)
-                    except Exception as notify_error:
-                        logger.error(f"Error in plugin error handler: {notify_error}")
-
-                if self._error_strategy == "fail_fast":
-                    raise HookError(error_msg) from e
-                elif self._error_strategy == "collect_all":
-                    errors.append(
-                        {
-                            "plugin": plugin_name,
-                            "error": e,
-                            "event": event_name,
-                        }
-                    )
+                errors = self._handle_hook_error(hook_info, e, event_name, errors, "async hook")
 
         if errors and self._error_strategy == "collect_all":
-            logger.warning(f"Async event '{event_name}' completed with " f"{len(errors)} errors")
+            logger.warning("Async event '%s' completed with %d errors", event_name, len(errors))
 
         return result
 
-    def get_hooks(self, event_name: str) -> List[Dict[str, Any]]:
+    def has_hooks(self, event_name: str) -> bool:
+        """Return whether triggering ``event_name`` would reach any hook.
+
+        Wildcard patterns are taken into account. Disabled plugins'
+        hooks still count — they are registered, just skipped at dispatch.
+
+        Args:
+            event_name: Event name to check.
+
+        Returns:
+            True if at least one exact or wildcard hook matches.
+        """
+        if not self._wildcard_count:
+            return bool(self._hooks.get(event_name))
+        return bool(self._get_matching_hooks(event_name))
+
+    def get_hooks(self, event_name: str) -> List[HookInfo]:
         """Return every hook that would run for an event, in priority order.
 
         Includes hooks registered against wildcard patterns that match
@@ -516,10 +1591,14 @@ class HookRegistry:
             event_name: Event name to resolve.
 
         Returns:
-            List of hook info dicts with keys ``callback``, ``plugin``,
-            ``plugin_name``, ``priority``, ``timeout``, ``is_async``.
+            List of :class:`HookInfo` records with fields ``callback``,
+            ``plugin``, ``plugin_name``, ``priority``, ``timeout``,
+            ``is_async``, ``parallel``, ``seq`` (registration order, used
+            to break priority ties), and ``bit`` (the plugin's
+            enabled-mask slot). Fields are also readable by key, e.g.
+            ``hook["priority"]``.
         """
-        return self._get_matching_hooks(event_name)
+        return list(self._get_matching_hooks(event_name))
 
     def get_all_events(self) -> List[str]:
         """Return every registered event name.
@@ -528,7 +1607,7 @@ class HookRegistry:
             The literal strings used at registration — wildcard patterns
             are returned as-is (e.g. ``"user.*"``).
         """
-        return list(self._hooks.keys())
+        return list(self._hooks)
 
     def clear_event(self, event_name: str) -> None:
         """Remove every hook registered under a single event name.
@@ -540,7 +1619,13 @@ class HookRegistry:
             event_name: Event name to clear.
         """
         if event_name in self._hooks:
-            del self._hooks[event_name]
+            for hook in self._hooks.pop(event_name):
+                self._release_bit(hook.bit)
+            del self._hook_index[event_name]
+            if "*" in event_name:
+                self._unindex_pattern(event_name)
+                self._wildcard_count -= 1
+            self._invalidate()
             logger.debug(f"Cleared all hooks for event '{event_name}'")
 
     def clear_all(self) -> None:
@@ -550,6 +1635,16 @@ class HookRegistry:
         scratch.
         """
         self._hooks.clear()
+        self._hook_index.clear()
+        self._trie = _TrieNode()
+        self._wildcard_count = 0
+        self._plugin_bits.clear()
+        self._bit_plugins[1:] = []
+        self._bit_refs[:] = [0]
+        self._free_bits.clear()
+        self._untracked_bits.clear()
+        self._mask_version = -1
+        self._invalidate()
         logger.debug("Cleared all hooks")
 
     def set_error_strategy(self, strategy: str) -> None:
@@ -569,20 +1664,51 @@ class HookRegistry:
         Raises:
             ValueError: If ``strategy`` is not one of the listed names.
         """
-        valid_strategies = ["log_and_continue", "fail_fast", "collect_all"]
-        if strategy not in valid_strategies:
-            raise ValueError(f"Invalid strategy. Must be one of {valid_strategies}")
+        handler = _ERROR_STRATEGIES.get(strategy)
+        if handler is None:
+            raise ValueError(f"Invalid strategy. Must be one of {list(_ERROR_STRATEGIES)}")
         self._error_strategy = strategy
+        self._apply_error_strategy = handler
         logger.debug(f"Error strategy set to '{strategy}'")
 
     def enable_hook_tracing(self, enabled: bool = True) -> None:
-        """Toggle per-hook timing logs for debugging.
+        """Toggle per-hook timing traces for debugging.
 
-        When on, each dispatch logs the elapsed time of every hook at
-        DEBUG level. Configure the root logger at DEBUG to see output.
+        When on, each hook execution appends a tracepoint to an in-memory
+        ring buffer holding the most recent 10,000 entries. Nothing is
+        formatted or logged during dispatch; call :meth:`get_trace` to
+        read and flush the buffer. Turning tracing off keeps entries
+        already recorded.
 
         Args:
             enabled: True to turn tracing on, False to turn it off.
         """
+        if enabled and self._trace is None:
+            self._trace = collections.deque(maxlen=_TRACE_SIZE)
         self._hook_tracing = enabled
         logger.debug(f"Hook tracing {'enabled' if enabled else 'disabled'}")
+
+    def get_trace(self) -> List[str]:
+        """Drain the tracing buffer into formatted lines.
+
+        Each line is also emitted at DEBUG level, so configuring the
+        logger at DEBUG shows the trace when it is flushed.
+
+        Returns:
+            One line per recorded hook execution, oldest first, e.g.
+            ``"Hook 'save' from 'audit' (priority=50) executed in
+            0.0012s"``. Empty if tracing was never enabled.
+        """
+        if not self._trace:
+            return []
+
+        lines = []
+        while self._trace:
+            _, kind, event_name, plugin_name, priority, elapsed_ns = self._trace.popleft()
+            line = (
+                f"{kind} '{event_name}' from '{plugin_name}' "
+                f"(priority={priority}) executed in {elapsed_ns / 1e9:.4f}s"
+            )
+            logger.debug(line)
+            lines.append(line)
+        return lines
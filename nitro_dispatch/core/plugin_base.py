@@ -1,6 +1,25 @@
 """Base class every Nitro Dispatch plugin must inherit from."""
 
-from typing import Any, Callable, Dict, List, Optional
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _legacy_hook_meta(func: Any) -> Optional[Tuple[str, int, Optional[float], bool, bool]]:
+    """Build ``_hook_meta`` for a method marked only with the ``_is_hook`` attributes.
+
+    Covers third-party or hand-rolled decorators written against the
+    original marker attributes (``_is_hook``, ``_event_name``, ``_priority``,
+    ``_timeout``), which predate the ``_hook_meta`` tuple.
+    """
+    if not callable(func) or not getattr(func, "_is_hook", False):
+        return None
+    return (
+        func._event_name,
+        getattr(func, "_priority", 50),
+        getattr(func, "_timeout", None),
+        bool(getattr(func, "_is_async", inspect.iscoroutinefunction(func))),
+        getattr(func, "_parallel", False),
+    )
 
 
 class PluginBase:
@@ -24,6 +43,11 @@ class PluginBase:
             by :meth:`PluginManager.enable_plugin` /
             :meth:`PluginManager.disable_plugin`.
 
+    Per-instance state lives in ``__slots__``. Subclasses get a regular
+    ``__dict__`` unless they declare ``__slots__`` themselves; a fully
+    slotted subclass must set ``name`` explicitly and cannot rebind its
+    class-level metadata per instance.
+
     Example:
         >>> from nitro_dispatch import PluginBase, hook
         >>> class WelcomePlugin(PluginBase):
@@ -36,15 +60,56 @@ class PluginBase:
         ...         return data
     """
 
+    __slots__ = ("_enabled", "_manager", "_hooks", "__weakref__")
+
     name: str = ""
     version: str = "1.0.0"
     description: str = ""
     author: str = ""
     dependencies: List[str] = []
 
+    # (attribute name, (event, priority, timeout, is_async, parallel)) for
+    # every @hook-decorated method, computed once per class by
+    # __init_subclass__.
+    _hook_specs: Tuple[Tuple[str, Tuple[str, int, Optional[float], bool, bool]], ...] = ()
+
+    # Bumped whenever any plugin's ``enabled`` flag is assigned, so the hook
+    # registry knows when its cached enabled-plugin bitmask is stale.
+    _state_version: int = 0
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the subclass's @hook-decorated methods once, at class creation.
+
+        Walks the MRO's class dicts (most-derived last) so overrides win and
+        an undecorated override removes the inherited hook. Descriptors such
+        as properties are never invoked. Methods marked only with the legacy
+        ``_is_hook`` / ``_event_name`` attributes are collected too. Hook
+        methods must be defined in the class body: one attached to the class
+        after it is created is not picked up; register it from
+        :meth:`on_load` with :meth:`register_hook` instead.
+        """
+        super().__init_subclass__(**kwargs)
+
+        specs: Dict[str, Tuple[str, int, Optional[float], bool, bool]] = {}
+        for klass in reversed(cls.__mro__):
+            for attr_name, value in vars(klass).items():
+                if attr_name.startswith("_"):
+                    continue
+                func = getattr(value, "__func__", value)
+                meta = getattr(func, "_hook_meta", None)
+                if meta is None:
+                    meta = _legacy_hook_meta(func)
+                if meta is not None:
+                    specs[attr_name] = meta
+                else:
+                    specs.pop(attr_name, None)
+
+        # Sorted by attribute name to keep the order dir() used to produce.
+        cls._hook_specs = tuple(sorted(specs.items()))
+
     def __init__(self) -> None:
         """Initialize the plugin instance and collect decorated hooks."""
-        self.enabled: bool = False
+        self._enabled: bool = False
         self._manager: Optional[Any] = None
         self._hooks: Dict[str, List[Any]] = {}
 
@@ -52,17 +117,29 @@ class PluginBase:
         # subclasses that mutate self.dependencies don't leak into siblings.
         # Only shadow when the class value is actually a list — otherwise
         # leave the invalid type intact for metadata validation to surface.
-        if isinstance(self.__class__.dependencies, list):
+        # Fully slotted subclasses have no instance dict to shadow into.
+        has_dict = hasattr(self, "__dict__")
+        if has_dict and isinstance(self.__class__.dependencies, list):
             self.dependencies = list(self.__class__.dependencies)
 
         # Only auto-name if name was not explicitly defined in the plugin class
         # Check if 'name' is in the class's own __dict__ (not inherited from
         # PluginBase)
-        if "name" not in self.__class__.__dict__ and not self.name:
+        if has_dict and "name" not in self.__class__.__dict__ and not self.name:
             self.name = self.__class__.__name__
 
         self._collect_decorated_hooks()
 
+    @property
+    def enabled(self) -> bool:
+        """Whether the plugin's hooks run when events fire."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        PluginBase._state_version += 1
+
     def on_load(self) -> None:
         """Run once when the plugin is loaded by the manager.
 
@@ -108,6 +185,7 @@ class PluginBase:
         callback: Callable,
         priority: int = 50,
         timeout: Optional[float] = None,
+        parallel: bool = False,
     ) -> None:
         """Register a callback for an event.
 
@@ -126,6 +204,9 @@ class PluginBase:
                 order.
             timeout: Maximum execution time in seconds, or ``None`` for no
                 limit. Exceeding raises :class:`HookTimeoutError`.
+            parallel: Allow an async callback to run concurrently with its
+                same-priority parallel neighbours in ``trigger_async``;
+                see :func:`nitro_dispatch.hook`.
 
         Example:
             >>> class MyPlugin(PluginBase):
@@ -138,7 +219,7 @@ class PluginBase:
             ...         return data
         """
         if self._manager:
-            self._manager.register_hook(event_name, callback, self, priority, timeout)
+            self._manager.register_hook(event_name, callback, self, priority, timeout, parallel)
         else:
             if event_name not in self._hooks:
                 self._hooks[event_name] = []
@@ -147,6 +228,7 @@ class PluginBase:
                     "callback": callback,
                     "priority": priority,
                     "timeout": timeout,
+                    "parallel": parallel,
                 }
             )
 
@@ -202,31 +284,20 @@ class PluginBase:
         """Gather @hook-decorated methods into ``self._hooks``.
 
         Called from ``__init__`` so the manager can register them at load
-        time. Skips private/magic attributes to avoid unnecessary access.
+        time. Only binds the methods listed in the class's precomputed
+        ``_hook_specs``; no per-instance attribute scan is needed.
         """
-        for attr_name in dir(self):
-            if attr_name.startswith("_"):
-                continue
-
-            try:
-                attr = getattr(self, attr_name)
-            except AttributeError:
-                continue
-
-            if callable(attr) and hasattr(attr, "_is_hook") and attr._is_hook:
-                event_name = attr._event_name
-                priority = getattr(attr, "_priority", 50)
-                timeout = getattr(attr, "_timeout", None)
-
-                if event_name not in self._hooks:
-                    self._hooks[event_name] = []
-                self._hooks[event_name].append(
-                    {
-                        "callback": attr,
-                        "priority": priority,
-                        "timeout": timeout,
-                    }
-                )
+        for attr_name, (event_name, priority, timeout, _, parallel) in self._hook_specs:
+            if event_name not in self._hooks:
+                self._hooks[event_name] = []
+            self._hooks[event_name].append(
+                {
+                    "callback": getattr(self, attr_name),
+                    "priority": priority,
+                    "timeout": timeout,
+                    "parallel": parallel,
+                }
+            )
 
     def __repr__(self) -> str:
         """Return a debug-friendly representation including name and version."""
@@ -1,11 +1,30 @@
 """Plugin manager that orchestrates plugin lifecycle and hook dispatch."""
 
+import collections
+import fnmatch
+import hashlib
 import importlib
-import importlib.util
-import inspect
+import os
+import re
 import sys
+import weakref
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from types import MappingProxyType, ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 import logging
 
 from .plugin_base import PluginBase
@@ -21,6 +40,130 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Modules imported by discover_plugins, keyed by resolved file path and
+# holding the file's ``(st_mtime_ns, st_size)`` stamp when they were executed.
+# Shared across managers so re-discovery only re-executes files that changed
+# on disk; the size catches rewrites within a coarse mtime tick.
+_DISCOVERY_CACHE: Dict[str, Tuple[Tuple[int, int], ModuleType]] = {}
+
+# Level names accepted by ``PluginManager(log_level=...)``.
+_LEVELS: Dict[str, int] = {
+    name: getattr(logging, name)
+    for name in ("CRITICAL", "FATAL", "ERROR", "WARNING", "WARN", "INFO", "DEBUG", "NOTSET")
+}
+
+# Shared stand-in for a plugin with no config section, so config misses
+# don't allocate an empty dict per lookup.
+_NO_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+# ``(name, version, dependencies)`` read from a throwaway instance, for plugin
+# classes whose metadata can't be taken from class attributes. Weakly keyed
+# so classes replaced by reload() can still be collected.
+_METADATA_CACHE: "weakref.WeakKeyDictionary[type, Tuple[str, str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _plugin_metadata(plugin_class: Type[PluginBase]) -> Tuple[str, str, Any]:
+    """Return ``(name, version, dependencies)`` for a plugin class.
+
+    Classes that keep :class:`PluginBase`'s ``__init__`` and declare a
+    string ``name`` and ``version`` are read straight from the class, which
+    is exactly what an instance would see. Anything else (a custom
+    ``__init__``, auto-naming, descriptors) is instantiated once and the
+    result cached for the class.
+    """
+    name = plugin_class.name
+    version = plugin_class.version
+    if (
+        plugin_class.__init__ is PluginBase.__init__
+        and name
+        and isinstance(name, str)
+        and isinstance(version, str)
+    ):
+        return name, version, plugin_class.dependencies
+
+    metadata = _METADATA_CACHE.get(plugin_class)
+    if metadata is None:
+        instance = plugin_class()
+        metadata = (instance.name, instance.version, instance.dependencies)
+        _METADATA_CACHE[plugin_class] = metadata
+    return metadata
+
+
+def _stat_stamp(stat: os.stat_result) -> Tuple[int, int]:
+    """Return the ``(st_mtime_ns, st_size)`` change stamp of a stat result."""
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _file_stamp(module: ModuleType) -> Optional[Tuple[int, int]]:
+    """Return the change stamp of a module's source file, or ``None`` if it has none."""
+    path = getattr(module, "__file__", None)
+    if not path:
+        return None
+    try:
+        return _stat_stamp(os.stat(path))
+    except OSError:
+        return None
+
+
+def _discovered_stamp(module: ModuleType) -> Optional[Tuple[int, int]]:
+    """Return the stamp discover_plugins executed ``module`` at, if it did."""
+    cached = _DISCOVERY_CACHE.get(getattr(module, "__file__", None) or "")
+    return cached[0] if cached is not None and cached[1] is module else None
+
+
+def _discovery_module_name(plugin_file: Path) -> str:
+    """Pick the ``sys.modules`` name a discovered plugin file is imported under.
+
+    The file's stem, unless another module already holds that name (a
+    same-named plugin in another directory, or a stdlib/third-party module
+    the file would shadow); then the stem plus a short hash of the path, so
+    each file keeps its own module object.
+    """
+    path = str(plugin_file)
+    cached = _DISCOVERY_CACHE.get(path)
+    if cached is not None:
+        return cached[1].__name__
+
+    stem = plugin_file.stem
+    existing = sys.modules.get(stem)
+    if existing is None or getattr(existing, "__file__", None) == path:
+        return stem
+    digest = hashlib.blake2b(path.encode(), digest_size=4).hexdigest()
+    return f"{stem}_{digest}"
+
+
+def _walk_matching(directory: Path, pattern: str, recursive: bool = True) -> Iterator[Path]:
+    """Yield files in (and, if ``recursive``, below) ``directory`` matching ``pattern``.
+
+    Same matches as ``directory.glob(pattern)`` / ``rglob(pattern)`` filtered
+    with ``is_file()``, for a plain file-name pattern, but each directory is
+    read once with ``os.scandir``: its cached entry types stand in for the
+    per-file ``stat`` calls, ``Path`` objects are only built for matches, and
+    names are tested against a single precompiled regex instead of going
+    through ``fnmatch`` each time. Like ``os.walk``, symlinked directories are
+    not descended into and unreadable subdirectories are skipped.
+    """
+    match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+    pending = [str(directory)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as scan:
+                entries = list(scan)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_file():
+                if match(os.path.normcase(entry.name)):
+                    yield Path(entry.path)
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+        # Reversed so the stack visits subdirectories in scandir order,
+        # depth-first, like os.walk.
+        pending.extend(reversed(subdirs))
+
 
 class PluginManager:
     """Central orchestrator for plugin lifecycle and event dispatch.
@@ -56,8 +199,26 @@ class PluginManager:
         {'user': 'alice', 'greeted': True}
     """
 
+    __slots__ = (
+        "_registry",
+        "_plugins",
+        "_plugin_classes",
+        "_plugin_hooks",
+        "_loading",
+        "_batch_lifecycle",
+        "_hold_lifecycle",
+        "_config",
+        "_loaded",
+        "_validate_metadata",
+        "_validated",
+        "_module_stamps",
+        "_topo_order",
+        "__weakref__",
+    )
+
     EVENT_PLUGIN_REGISTERED = "nitro.plugin.registered"
     EVENT_PLUGIN_LOADED = "nitro.plugin.loaded"
+    EVENT_PLUGINS_BATCH_LOADED = "nitro.plugins.batch_loaded"
     EVENT_PLUGIN_UNLOADED = "nitro.plugin.unloaded"
     EVENT_PLUGIN_ERROR = "nitro.plugin.error"
     EVENT_APP_STARTUP = "nitro.app.startup"
@@ -68,6 +229,8 @@ class PluginManager:
         config: Optional[Dict[str, Any]] = None,
         log_level: str = "INFO",
         validate_metadata: bool = True,
+        inline_sync_hooks: bool = False,
+        executor: Optional[Executor] = None,
     ) -> None:
         """Initialize the manager.
 
@@ -77,28 +240,65 @@ class PluginManager:
                 :meth:`PluginBase.get_config`.
             log_level: Root logging level applied via
                 ``logging.basicConfig``. Accepts the usual names
-                (``DEBUG``, ``INFO``, ``WARNING``, ``ERROR``).
+                (``DEBUG``, ``INFO``, ``WARNING``, ``ERROR``). Like
+                ``basicConfig`` itself, has no effect once the root logger
+                has handlers.
             validate_metadata: When True (default), every registered
                 plugin has its ``name``, ``version``, and
                 ``dependencies`` attributes validated. Disable for
                 prototyping or when registering dynamically generated
                 classes.
+            inline_sync_hooks: In :meth:`trigger_async`, call sync hooks
+                that have no timeout directly on the event loop thread
+                instead of via the default executor. Saves a thread
+                handoff per hook; only use it when sync hooks never block.
+            executor: Executor used for sync hooks in :meth:`trigger_async`,
+                e.g. a ``ThreadPoolExecutor`` sized for your plugins.
+                Defaults to the event loop's default executor.
         """
-        self._registry = HookRegistry()
+        self._registry = HookRegistry(inline_sync_hooks=inline_sync_hooks, executor=executor)
         self._plugins: Dict[str, PluginBase] = {}
         self._plugin_classes: Dict[str, Type[PluginBase]] = {}
+        # Cached _dependency_order() result; None whenever _plugin_classes
+        # changed since it was computed.
+        self._topo_order: Optional[Tuple[List[str], List[str]]] = None
+        # (event_name, callback) for every hook registered on behalf of a
+        # plugin, keyed by plugin name, so unload() touches only its own.
+        self._plugin_hooks: Dict[str, List[Tuple[str, Callable]]] = {}
+        # Plugins whose load() is in progress, outermost first: the "grey"
+        # set of the dependency walk, used to report cycles.
+        self._loading: Dict[str, None] = {}
+        # EVENT_PLUGIN_LOADED payloads of every load() completed while
+        # load_all() runs, nested loads included, for its batch event; None
+        # outside load_all(). _hold_lifecycle suppresses the per-plugin
+        # triggers meanwhile (batch_events=True).
+        self._batch_lifecycle: Optional[List[Dict[str, Any]]] = None
+        self._hold_lifecycle: bool = False
         self._config: Dict[str, Any] = config or {}
         self._loaded: bool = False
         self._validate_metadata: bool = validate_metadata
-
-        logging.basicConfig(level=getattr(logging, log_level.upper()))
+        # Registered classes whose metadata already passed validation, so
+        # re-registering the same class (e.g. re-discovery) skips it.
+        self._validated: Set[Type[PluginBase]] = set()
+        # (st_mtime_ns, st_size) of each module's file as of its last
+        # reload(), so an unchanged module isn't re-executed.
+        self._module_stamps: Dict[str, Tuple[int, int]] = {}
+
+        # Resolved unconditionally so an invalid level always raises.
+        name = log_level.upper()
+        level = _LEVELS[name] if name in _LEVELS else getattr(logging, name)
+        # basicConfig is a no-op once the root logger has handlers; check
+        # first so extra managers don't take the logging lock for nothing.
+        if not logging.root.handlers:
+            logging.basicConfig(level=level)
 
     def register(self, plugin_class: Type[PluginBase], validate: bool = True) -> None:
         """Register a plugin class so it can later be loaded.
 
-        Registration stores the class — no instance is kept. The class is
-        instantiated once temporarily to read its ``name`` and validate
-        metadata. Registering a name that already exists overwrites the
+        Registration stores the class — no instance is kept. Metadata is
+        read from class attributes; only classes with a custom
+        ``__init__`` or no explicit ``name`` are instantiated, once, to
+        read it. Registering a name that already exists overwrites the
         previous registration and logs a warning.
 
         Triggers ``EVENT_PLUGIN_REGISTERED`` on success.
@@ -120,38 +320,91 @@ class PluginManager:
             >>> mgr = PluginManager()
             >>> mgr.register(MyPlugin)
         """
+        plugin_name, version = self._register_class(plugin_class, validate)
+        self.trigger(
+            self.EVENT_PLUGIN_REGISTERED,
+            {"plugin_name": plugin_name, "version": version},
+        )
+
+    def register_many(
+        self, plugin_classes: Iterable[Type[PluginBase]], validate: bool = True
+    ) -> List[str]:
+        """Register several plugin classes, announcing them once all are stored.
+
+        Equivalent to calling :meth:`register` for each class in order,
+        except that every ``EVENT_PLUGIN_REGISTERED`` is deferred until the
+        whole batch is stored, so listeners see the complete set. If a
+        class fails, the ones before it stay registered and their events
+        still fire before the error propagates.
+
+        Args:
+            plugin_classes: Subclasses of :class:`PluginBase`, in order.
+            validate: Per-call override for metadata validation, as in
+                :meth:`register`.
+
+        Returns:
+            The registered plugin names, in order.
+
+        Raises:
+            PluginRegistrationError: If a class does not inherit from
+                :class:`PluginBase`.
+            ValidationError: If metadata validation is enabled and a
+                class's metadata is invalid.
+
+        Example:
+            >>> mgr = PluginManager()
+            >>> mgr.register_many([PluginC, PluginB, PluginA])
+            ['c', 'b', 'a']
+        """
+        registered: List[Tuple[str, str]] = []
+        try:
+            for plugin_class in plugin_classes:
+                registered.append(self._register_class(plugin_class, validate))
+        finally:
+            for plugin_name, version in registered:
+                self.trigger(
+                    self.EVENT_PLUGIN_REGISTERED,
+                    {"plugin_name": plugin_name, "version": version},
+                )
+        return [plugin_name for plugin_name, _ in registered]
+
+    def _register_class(self, plugin_class: Type[PluginBase], validate: bool) -> Tuple[str, str]:
+        """Validate and store a plugin class without announcing it.
+
+        Returns:
+            ``(plugin_name, version)`` for the lifecycle event.
+        """
         if not issubclass(plugin_class, PluginBase):
             raise PluginRegistrationError(f"{plugin_class.__name__} must inherit from PluginBase")
 
-        temp_instance = plugin_class()
-        plugin_name = temp_instance.name
+        plugin_name, version, dependencies = _plugin_metadata(plugin_class)
 
-        if validate and self._validate_metadata:
-            self._validate_plugin_metadata(temp_instance)
+        if validate and self._validate_metadata and plugin_class not in self._validated:
+            self._validate_plugin_metadata(plugin_name, version, dependencies)
+            self._validated.add(plugin_class)
 
         if plugin_name in self._plugin_classes:
-            logger.warning(f"Plugin '{plugin_name}' is already registered. Overwriting.")
+            logger.warning("Plugin '%s' is already registered. Overwriting.", plugin_name)
+            if self._plugin_classes[plugin_name] is not plugin_class:
+                self._validated.discard(self._plugin_classes[plugin_name])
 
         self._plugin_classes[plugin_name] = plugin_class
-        logger.info(f"Registered plugin class '{plugin_name}' v{temp_instance.version}")
-
-        self.trigger(
-            self.EVENT_PLUGIN_REGISTERED,
-            {"plugin_name": plugin_name, "version": temp_instance.version},
-        )
+        self._topo_order = None
+        logger.info("Registered plugin class '%s' v%s", plugin_name, version)
+        return plugin_name, version
 
-    def _validate_plugin_metadata(self, plugin: PluginBase) -> None:
-        """Validate ``name``, ``version``, and ``dependencies`` on an instance."""
-        if not plugin.name or not isinstance(plugin.name, str):
+    def _validate_plugin_metadata(self, name: Any, version: Any, dependencies: Any) -> None:
+        """Validate a plugin's ``name``, ``version``, and ``dependencies``."""
+        if not name or not isinstance(name, str):
             raise ValidationError("Plugin must have a valid 'name' attribute")
 
-        if not plugin.version or not isinstance(plugin.version, str):
-            raise ValidationError(f"Plugin '{plugin.name}' must have a valid 'version' attribute")
+        if not version or not isinstance(version, str):
+            raise ValidationError(f"Plugin '{name}' must have a valid 'version' attribute")
 
-        if not isinstance(plugin.dependencies, list):
-            raise ValidationError(f"Plugin '{plugin.name}' dependencies must be a list")
+        if not isinstance(dependencies, list):
+            raise ValidationError(f"Plugin '{name}' dependencies must be a list")
 
-        logger.debug(f"Plugin '{plugin.name}' metadata validated successfully")
+        logger.debug(f"Plugin '{name}' metadata validated successfully")
 
     def unregister(self, plugin_name: str) -> None:
         """Remove a plugin's registration, unloading it first if needed.
@@ -168,7 +421,8 @@ class PluginManager:
         if plugin_name in self._plugins:
             self.unload(plugin_name)
 
-        del self._plugin_classes[plugin_name]
+        self._validated.discard(self._plugin_classes.pop(plugin_name))
+        self._topo_order = None
         logger.info(f"Unregistered plugin '{plugin_name}'")
 
     def load(self, plugin_name: str) -> PluginBase:
@@ -177,6 +431,8 @@ class PluginManager:
         Loading recursively loads every name in the plugin's
         ``dependencies`` first, then instantiates the target class, wires
         up its decorated hooks, and calls :meth:`PluginBase.on_load`.
+        A dependency that leads back to a plugin still being loaded is
+        reported as a :class:`DependencyError` naming the cycle.
         If the plugin is already loaded, the existing instance is
         returned and a warning is logged.
 
@@ -193,7 +449,9 @@ class PluginManager:
             PluginNotFoundError: If the plugin is not registered.
             PluginLoadError: If instantiation, hook registration, or
                 ``on_load`` raises.
-            DependencyError: If any dependency fails to load.
+            DependencyError: If any dependency fails to load, or
+                ``plugin_name`` depends on itself through the plugin
+                currently being loaded.
         """
         if plugin_name not in self._plugin_classes:
             raise PluginNotFoundError(f"Plugin '{plugin_name}' not registered")
@@ -202,7 +460,14 @@ class PluginManager:
             logger.warning(f"Plugin '{plugin_name}' already loaded")
             return self._plugins[plugin_name]
 
+        if plugin_name in self._loading:
+            chain = list(self._loading)
+            start = chain.index(plugin_name)
+            cycle = chain[start:] + [plugin_name]
+            raise DependencyError(f"Circular dependency: {' -> '.join(cycle)}")
+
         plugin_class = self._plugin_classes[plugin_name]
+        self._loading[plugin_name] = None
 
         try:
             plugin = plugin_class()
@@ -218,19 +483,27 @@ class PluginManager:
                             f"Failed to load dependency '{dep_name}' for " f"'{plugin_name}': {e}"
                         ) from e
 
+            entries = []
             for event_name, hook_list in plugin._hooks.items():
                 for hook_data in hook_list:
                     if isinstance(hook_data, dict):
-                        self.register_hook(
-                            event_name,
-                            hook_data["callback"],
-                            plugin,
-                            hook_data.get("priority", 50),
-                            hook_data.get("timeout"),
+                        entries.append(
+                            (
+                                event_name,
+                                hook_data["callback"],
+                                plugin,
+                                hook_data.get("priority", 50),
+                                hook_data.get("timeout"),
+                                hook_data.get("parallel", False),
+                            )
                         )
                     else:
                         # Legacy format: bare callable stored without metadata.
-                        self.register_hook(event_name, hook_data, plugin)
+                        entries.append((event_name, hook_data, plugin, 50, None, False))
+            self._registry.register_many(entries)
+            self._plugin_hooks.setdefault(plugin_name, []).extend(
+                (entry[0], entry[1]) for entry in entries
+            )
 
             plugin.on_load()
             plugin.enabled = True
@@ -238,10 +511,11 @@ class PluginManager:
             self._plugins[plugin_name] = plugin
             logger.info(f"Loaded plugin '{plugin_name}' v{plugin.version}")
 
-            self.trigger(
-                self.EVENT_PLUGIN_LOADED,
-                {"plugin_name": plugin_name, "version": plugin.version},
-            )
+            loaded_event = {"plugin_name": plugin_name, "version": plugin.version}
+            if self._batch_lifecycle is not None:
+                self._batch_lifecycle.append(loaded_event)
+            if not self._hold_lifecycle:
+                self.trigger(self.EVENT_PLUGIN_LOADED, loaded_event)
 
             return plugin
 
@@ -254,13 +528,30 @@ class PluginManager:
             self.trigger(self.EVENT_PLUGIN_ERROR, error_data)
             raise PluginLoadError(f"Failed to load plugin '{plugin_name}': {e}") from e
 
-    def load_all(self) -> List[str]:
+        finally:
+            del self._loading[plugin_name]
+
+    def load_all(self, batch_events: bool = False) -> List[str]:
         """Load every registered plugin, respecting dependencies.
 
-        Iterates registered plugins and calls :meth:`load` on each.
-        Individual load failures are logged (not raised) so one broken
-        plugin does not block the rest; the returned list contains only
-        the names that loaded successfully.
+        Plugins are topologically sorted on their declared dependencies
+        first, so every :meth:`load` finds its dependencies already
+        loaded and never recurses. Plugins caught in a dependency cycle
+        are reported as failed instead of loaded. Individual load
+        failures are logged (not raised) so one broken plugin does not
+        block the rest; the returned list contains only the names that
+        loaded successfully.
+
+        Triggers ``EVENT_PLUGINS_BATCH_LOADED`` once at the end, with
+        ``{"plugins": [{"plugin_name": ..., "version": ...}, ...]}`` for
+        every plugin loaded during the call, in completion order. That
+        includes plugins loaded from another plugin's ``on_load`` or from
+        a lifecycle hook, not only those the returned list names.
+
+        Args:
+            batch_events: When True, the per-plugin ``EVENT_PLUGIN_LOADED``
+                triggers are suppressed for this call (nested loads
+                included), leaving the single batch event. Saves a dispatch per plugin at startup.
 
         Returns:
             Names of plugins that loaded successfully, in load order.
@@ -273,15 +564,27 @@ class PluginManager:
         """
         loaded_plugins: List[str] = []
         failed_plugins: List[str] = []
+        order, cyclic = self._dependency_order()
+
+        self._batch_lifecycle = []
+        self._hold_lifecycle = batch_events
+        try:
+            for plugin_name in order:
+                if plugin_name not in self._plugins:
+                    try:
+                        self.load(plugin_name)
+                        loaded_plugins.append(plugin_name)
+                    except Exception as e:
+                        logger.error(f"Failed to load plugin '{plugin_name}': {e}")
+                        failed_plugins.append(plugin_name)
+        finally:
+            batch, self._batch_lifecycle = self._batch_lifecycle, None
+            self._hold_lifecycle = False
 
-        for plugin_name in self._plugin_classes.keys():
+        for plugin_name in cyclic:
             if plugin_name not in self._plugins:
-                try:
-                    self.load(plugin_name)
-                    loaded_plugins.append(plugin_name)
-                except Exception as e:
-                    logger.error(f"Failed to load plugin '{plugin_name}': {e}")
-                    failed_plugins.append(plugin_name)
+                logger.error(f"Failed to load plugin '{plugin_name}': circular dependency")
+                failed_plugins.append(plugin_name)
 
         self._loaded = True
         logger.info(f"Loaded {len(loaded_plugins)} plugins. " f"Failed: {len(failed_plugins)}")
@@ -289,8 +592,54 @@ class PluginManager:
         if failed_plugins:
             logger.warning(f"Failed plugins: {', '.join(failed_plugins)}")
 
+        self.trigger(self.EVENT_PLUGINS_BATCH_LOADED, {"plugins": batch})
+
         return loaded_plugins
 
+    def _dependency_order(self) -> Tuple[List[str], List[str]]:
+        """Topologically sort registered plugins with Kahn's algorithm.
+
+        Only edges between registered plugins are considered; a missing
+        dependency is left for :meth:`load` to report. The result is
+        cached until the set of registered classes changes, so repeated
+        :meth:`load_all` calls skip the sort.
+
+        Returns:
+            ``(order, cyclic)``: plugin names with every dependency before
+            its dependents (registration order among independent
+            plugins), and the names that could not be ordered because
+            they sit on or behind a dependency cycle.
+        """
+        if self._topo_order is not None:
+            return self._topo_order
+
+        indegree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {name: [] for name in self._plugin_classes}
+        for plugin_name, plugin_class in self._plugin_classes.items():
+            dependencies = _plugin_metadata(plugin_class)[2]
+            if not isinstance(dependencies, (list, tuple)):
+                dependencies = ()
+            count = 0
+            for dep_name in dict.fromkeys(dependencies):
+                if dep_name in dependents:
+                    dependents[dep_name].append(plugin_name)
+                    count += 1
+            indegree[plugin_name] = count
+
+        ready = collections.deque(name for name, count in indegree.items() if not count)
+        order: List[str] = []
+        while ready:
+            plugin_name = ready.popleft()
+            order.append(plugin_name)
+            for dependent in dependents[plugin_name]:
+                indegree[dependent] -= 1
+                if not indegree[dependent]:
+                    ready.append(dependent)
+
+        cyclic = [name for name, count in indegree.items() if count]
+        self._topo_order = (order, cyclic)
+        return self._topo_order
+
     def unload(self, plugin_name: str) -> None:
         """Unload a single plugin and detach its hooks.
 
@@ -312,11 +661,8 @@ class PluginManager:
             plugin.on_unload()
             plugin.enabled = False
 
-            for event_name in self._registry.get_all_events():
-                hooks = self._registry.get_hooks(event_name)
-                for hook_info in hooks:
-                    if hook_info["plugin"] == plugin:
-                        self._registry.unregister(event_name, hook_info["callback"], plugin)
+            for event_name, callback in self._plugin_hooks.pop(plugin_name, ()):
+                self._registry.unregister(event_name, callback, plugin)
 
             del self._plugins[plugin_name]
             logger.info(f"Unloaded plugin '{plugin_name}'")
@@ -333,7 +679,7 @@ class PluginManager:
         Errors from individual unloads are logged and do not halt the
         sweep; the manager's loaded-state flag is cleared on completion.
         """
-        plugin_names = list(self._plugins.keys())
+        plugin_names = tuple(self._plugins)
         for plugin_name in plugin_names:
             try:
                 self.unload(plugin_name)
@@ -348,7 +694,9 @@ class PluginManager:
 
         Unloads the plugin (if loaded), reloads its defining module via
         :func:`importlib.reload`, refreshes the stored class reference
-        so the new definition is used, then calls :meth:`load`. Useful
+        so the new definition is used, then calls :meth:`load`. The
+        module is only re-executed if its file changed since it was last
+        reloaded (or discovered); otherwise the plugin is just re-created. Useful
         during development for editing a plugin without restarting the
         host process.
 
@@ -371,23 +719,33 @@ class PluginManager:
             self.unload(plugin_name)
 
         plugin_class = self._plugin_classes[plugin_name]
-        if hasattr(plugin_class, "__module__"):
-            module_name = plugin_class.__module__
-            if module_name in sys.modules:
-                logger.debug(f"Reloading module '{module_name}'")
-                reloaded_module = importlib.reload(sys.modules[module_name])
-
-                # importlib.reload replaces the module's classes with new
-                # objects. Refresh our stored class reference so the subsequent
-                # load() instantiates the new code, not the pre-reload class.
-                for _, obj in inspect.getmembers(reloaded_module, inspect.isclass):
-                    if (
-                        issubclass(obj, PluginBase)
-                        and obj is not PluginBase
-                        and obj().name == plugin_name
-                    ):
-                        self._plugin_classes[plugin_name] = obj
-                        break
+        module_name = plugin_class.__module__
+        module = sys.modules.get(module_name)
+        stamp = _file_stamp(module) if module is not None else None
+        if stamp is not None and stamp == self._module_stamps.get(
+            module_name, _discovered_stamp(module)
+        ):
+            logger.debug(f"Module '{module_name}' unchanged on disk; not re-executing")
+        elif module is not None:
+            logger.debug(f"Reloading module '{module_name}'")
+            reloaded_module = importlib.reload(module)
+            if stamp is not None:
+                self._module_stamps[module_name] = stamp
+
+            # importlib.reload replaces the module's classes with new
+            # objects. Refresh our stored class reference so the subsequent
+            # load() instantiates the new code, not the pre-reload class.
+            for obj in list(vars(reloaded_module).values()):
+                if (
+                    isinstance(obj, type)
+                    and issubclass(obj, PluginBase)
+                    and obj is not PluginBase
+                    and _plugin_metadata(obj)[0] == plugin_name
+                ):
+                    self._validated.discard(plugin_class)
+                    self._plugin_classes[plugin_name] = obj
+                    self._topo_order = None
+                    break
 
         return self.load(plugin_name)
 
@@ -401,9 +759,12 @@ class PluginManager:
 
         Walks ``directory`` (optionally recursively), imports each file
         matching ``pattern`` by file path, and registers every
-        :class:`PluginBase` subclass defined directly in that module.
+        :class:`PluginBase` subclass defined directly in that module, in
+        definition order.
         Errors from individual files are logged and skipped so one
-        broken plugin does not halt discovery.
+        broken plugin does not halt discovery. Imported modules are cached
+        per file path and modification time, so discovering the same
+        directory again only re-executes files that changed.
 
         Args:
             directory: Directory to search. Expanded and resolved to an
@@ -434,32 +795,27 @@ class PluginManager:
         discovered: List[str] = []
 
         try:
-            if recursive:
-                plugin_files = directory.rglob(pattern)
+            if "/" not in pattern and os.sep not in pattern:
+                plugin_files = _walk_matching(directory, pattern, recursive)
             else:
-                plugin_files = directory.glob(pattern)
+                globbed = directory.rglob(pattern) if recursive else directory.glob(pattern)
+                plugin_files = (path for path in globbed if path.is_file())
 
             for plugin_file in plugin_files:
-                if not plugin_file.is_file():
-                    continue
-
                 try:
-                    module_name = plugin_file.stem
-                    spec = importlib.util.spec_from_file_location(module_name, plugin_file)
-                    if spec and spec.loader:
-                        module = importlib.util.module_from_spec(spec)
-                        sys.modules[module_name] = module
-                        spec.loader.exec_module(module)
-
-                        for name, obj in inspect.getmembers(module, inspect.isclass):
+                    module_name = _discovery_module_name(plugin_file)
+                    module = self._import_plugin_file(plugin_file, module_name)
+                    if module is not None:
+                        # Definition order; the __module__ test is cheapest and
+                        # rejects everything the file merely imported.
+                        for obj in list(vars(module).values()):
                             if (
-                                issubclass(obj, PluginBase)
-                                and obj is not PluginBase
-                                and obj.__module__ == module_name
+                                isinstance(obj, type)
+                                and getattr(obj, "__module__", None) == module_name
+                                and issubclass(obj, PluginBase)
                             ):
-
                                 self.register(obj)
-                                plugin_name = obj().name
+                                plugin_name = _plugin_metadata(obj)[0]
                                 discovered.append(plugin_name)
                                 logger.debug(
                                     f"Discovered plugin '{plugin_name}' from {plugin_file}"
@@ -475,6 +831,40 @@ class PluginManager:
         except Exception as e:
             raise PluginDiscoveryError(f"Plugin discovery failed: {e}") from e
 
+    def _import_plugin_file(self, plugin_file: Path, module_name: str) -> Optional[ModuleType]:
+        """Import a plugin file by path, reusing the module if the file is unchanged.
+
+        Args:
+            plugin_file: Path of the ``.py`` file to import.
+            module_name: Name to register the module under in ``sys.modules``.
+
+        Returns:
+            The executed module, or ``None`` if no loader could be found.
+        """
+        # Deferred so importing the manager doesn't pull in importlib.util
+        # for applications that never discover plugins from disk.
+        import importlib.util
+
+        path = str(plugin_file)
+        stamp = _stat_stamp(plugin_file.stat())
+
+        cached = _DISCOVERY_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            module = cached[1]
+            sys.modules[module_name] = module
+            logger.debug(f"Reusing cached module for {plugin_file}")
+            return module
+
+        spec = importlib.util.spec_from_file_location(module_name, plugin_file)
+        if not (spec and spec.loader):
+            return None
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        _DISCOVERY_CACHE[path] = (stamp, module)
+        return module
+
     def register_hook(
         self,
         event_name: str,
@@ -482,6 +872,7 @@ class PluginManager:
         plugin: Optional[PluginBase] = None,
         priority: int = 50,
         timeout: Optional[float] = None,
+        parallel: bool = False,
     ) -> None:
         """Register a callback for an event on the underlying registry.
 
@@ -497,8 +888,12 @@ class PluginManager:
                 hooks. Disabled plugins have their hooks skipped.
             priority: Execution order — higher runs first.
             timeout: Maximum execution time in seconds, or ``None``.
+            parallel: Let an async callback run concurrently with other
+                parallel hooks of the same priority in :meth:`trigger_async`.
         """
-        self._registry.register(event_name, callback, plugin, priority, timeout)
+        self._registry.register(event_name, callback, plugin, priority, timeout, parallel)
+        if plugin is not None:
+            self._plugin_hooks.setdefault(plugin.name, []).append((event_name, callback))
 
     def unregister_hook(
         self,
@@ -523,7 +918,8 @@ class PluginManager:
         Async hooks are skipped with a warning — use
         :meth:`trigger_async` when any listener is ``async def``. Each
         hook that returns a non-``None`` value replaces ``data`` for
-        the next hook in the chain.
+        the next hook in the chain. The payload is shared, not copied:
+        in-place mutations are visible to later hooks and the caller.
 
         Args:
             event_name: Event name to fire. Matched literally plus by
@@ -549,6 +945,8 @@ class PluginManager:
         Handles both sync and async hooks. Sync hooks are dispatched to
         a thread-pool executor so they don't block the event loop; this
         means sync hooks must be thread-safe when invoked this way.
+        Async hooks declared ``parallel`` are awaited together per
+        priority tier rather than one after another.
 
         Args:
             event_name: Event name to fire.
@@ -566,6 +964,46 @@ class PluginManager:
         """
         return await self._registry.trigger_async(event_name, data)
 
+    def trigger_batch(self, event_name: str, payloads: Iterable[Any]) -> List[Any]:
+        """Fire one event per payload, resolving matching hooks once.
+
+        Behaves like calling :meth:`trigger` for each payload in turn,
+        but without repeating hook resolution, which makes it the
+        cheaper choice for high-rate events such as metrics.
+
+        Args:
+            event_name: Event name to fire.
+            payloads: Payloads to dispatch, in order.
+
+        Returns:
+            The resulting payload for each input, in input order.
+
+        Raises:
+            HookError: If the error strategy is ``fail_fast`` and a
+                hook raises.
+
+        Example:
+            >>> mgr.trigger_batch("metric", [{"v": 1}, {"v": 2}])
+            [{'v': 1}, {'v': 2}]
+        """
+        return self._registry.trigger_batch(event_name, payloads)
+
+    async def trigger_batch_async(self, event_name: str, payloads: Iterable[Any]) -> List[Any]:
+        """Async counterpart of :meth:`trigger_batch`.
+
+        Args:
+            event_name: Event name to fire.
+            payloads: Payloads to dispatch, in order.
+
+        Returns:
+            The resulting payload for each input, in input order.
+
+        Raises:
+            HookError: If the error strategy is ``fail_fast`` and a
+                hook raises.
+        """
+        return await self._registry.trigger_batch_async(event_name, payloads)
+
     def get_plugin(self, plugin_name: str) -> Optional[PluginBase]:
         """Return a loaded plugin by name, or ``None`` if not loaded.
 
@@ -578,14 +1016,18 @@ class PluginManager:
         """
         return self._plugins.get(plugin_name)
 
-    def get_all_plugins(self) -> Dict[str, PluginBase]:
-        """Return a shallow copy of the loaded-plugins map.
+    def get_all_plugins(self) -> Mapping[str, PluginBase]:
+        """Return a read-only view of the loaded-plugins map.
+
+        The view is live: it reflects later loads and unloads without
+        being fetched again. Wrap it in ``dict(...)`` for a snapshot, e.g.
+        before unloading plugins while iterating.
 
         Returns:
-            A new dict mapping plugin name to plugin instance. Mutating
-            the returned dict does not affect the manager's state.
+            A :class:`types.MappingProxyType` mapping plugin name to
+            plugin instance. It cannot be mutated.
         """
-        return self._plugins.copy()
+        return MappingProxyType(self._plugins)
 
     def get_registered_plugins(self) -> List[str]:
         """Return names of every registered plugin class.
@@ -593,7 +1035,7 @@ class PluginManager:
         Returns:
             Plugin names, including those not yet loaded.
         """
-        return list(self._plugin_classes.keys())
+        return list(self._plugin_classes)
 
     def get_loaded_plugins(self) -> List[str]:
         """Return names of every currently-loaded plugin.
@@ -601,7 +1043,7 @@ class PluginManager:
         Returns:
             Plugin names for loaded instances only.
         """
-        return list(self._plugins.keys())
+        return list(self._plugins)
 
     def is_loaded(self, plugin_name: str) -> bool:
         """Report whether a plugin is currently loaded.
@@ -660,8 +1102,7 @@ class PluginManager:
         Returns:
             The configured value, or ``default`` if unset.
         """
-        plugin_config = self._config.get(plugin_name, {})
-        return plugin_config.get(key, default)
+        return self._config.get(plugin_name, _NO_CONFIG).get(key, default)
 
     def set_error_strategy(self, strategy: str) -> None:
         """Choose how hook exceptions are handled during dispatch.
@@ -682,17 +1123,27 @@ class PluginManager:
         self._registry.set_error_strategy(strategy)
 
     def enable_hook_tracing(self, enabled: bool = True) -> None:
-        """Toggle per-hook timing logs for debugging.
+        """Toggle per-hook timing traces for debugging.
 
-        When enabled, every dispatch logs the elapsed time of each
-        hook at DEBUG level. Combine with ``log_level="DEBUG"`` on
-        the manager to actually see the output.
+        When enabled, every hook execution is timed into an in-memory
+        ring buffer instead of being logged inline. Call
+        :meth:`get_trace` to read it; flushed lines are also logged at
+        DEBUG, so combine with ``log_level="DEBUG"`` to see them.
 
         Args:
             enabled: True to turn tracing on, False to turn it off.
         """
         self._registry.enable_hook_tracing(enabled)
 
+    def get_trace(self) -> List[str]:
+        """Flush and return the hook timings recorded while tracing.
+
+        Returns:
+            Formatted lines, oldest first; see
+            :meth:`HookRegistry.get_trace`.
+        """
+        return self._registry.get_trace()
+
     def get_events(self) -> List[str]:
         """Return every event name with at least one registered hook.
 
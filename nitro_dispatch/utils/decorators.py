@@ -1,6 +1,7 @@
 """Decorators for declaring plugin hooks."""
 
-import asyncio
+import inspect
+import sys
 from functools import wraps
 from typing import Callable, Optional
 
@@ -10,6 +11,7 @@ def hook(
     priority: int = 50,
     timeout: Optional[float] = None,
     async_hook: bool = False,
+    parallel: bool = False,
 ) -> Callable:
     """Mark a plugin method as a hook for an event.
 
@@ -28,10 +30,17 @@ def hook(
             no limit. Exceeding raises :class:`HookTimeoutError`.
         async_hook: Force-mark the method as async. Normally left
             ``False`` — auto-detection covers the common cases.
+        parallel: Declare an async hook independent of its neighbours.
+            In :meth:`PluginManager.trigger_async`, consecutive parallel
+            async hooks at the same priority run concurrently via
+            :func:`asyncio.gather` on the same input, and their return
+            values are ignored. Use for observers that only do I/O.
 
     Returns:
-        A decorator that wraps the method with hook metadata and
-        preserves its original signature via :func:`functools.wraps`.
+        A decorator that stamps hook metadata onto the method and returns
+        the method itself, so dispatch calls it without an extra frame.
+        Only ``async_hook=True`` on a plain function wraps it, in a
+        coroutine function built with :func:`functools.wraps`.
 
     Example:
         >>> from nitro_dispatch import PluginBase, hook
@@ -52,31 +61,33 @@ def hook(
         ...         return data
     """
 
-    def decorator(func: Callable) -> Callable:
-        is_async = async_hook or asyncio.iscoroutinefunction(func)
-
-        if is_async:
+    event_name = sys.intern(event_name)
 
+    def decorator(func: Callable) -> Callable:
+        is_coroutine = inspect.iscoroutinefunction(func)
+        is_async = async_hook or is_coroutine
+        wrapper = func
+
+        if is_async and not is_coroutine:
+            # Forced async on a plain function that returns an awaitable:
+            # the only case that needs a wrapper, so the registry sees a
+            # coroutine function.
             @wraps(func)
             async def async_wrapper(self, *args, **kwargs):
                 return await func(self, *args, **kwargs)
 
             wrapper = async_wrapper
 
-        else:
-
-            @wraps(func)
-            def sync_wrapper(self, *args, **kwargs):
-                return func(self, *args, **kwargs)
-
-            wrapper = sync_wrapper
-
-        # Mark the function as a hook with metadata
+        # Mark the function as a hook with metadata. ``_hook_meta`` is what
+        # PluginBase reads when a subclass is created; the individual
+        # attributes are kept for introspection and backward compatibility.
+        wrapper._hook_meta = (event_name, priority, timeout, is_async, parallel)
         wrapper._is_hook = True
         wrapper._event_name = event_name
         wrapper._priority = priority
         wrapper._timeout = timeout
         wrapper._is_async = is_async
+        wrapper._parallel = parallel
 
         return wrapper
 
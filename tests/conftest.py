@@ -0,0 +1,102 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+
+@dataclass(frozen=True)
+class DiscoveryCorpus:
+    """Pre-written plugin directories for discovery tests."""
+
+    basic: Path
+    recursive: Path
+    invalid: Path
+    broken: Path
+    dir_matches: Path
+
+
+@pytest.fixture(scope="session")
+def discovery_corpus(tmp_path_factory):
+    """Write every read-only discovery corpus once per test session.
+
+    Tests must not modify these directories; tests that edit plugin files
+    (reload, cache invalidation) create their own temporary directory.
+    """
+    root = tmp_path_factory.mktemp("discovery")
+
+    basic = root / "basic"
+    basic.mkdir()
+    (basic / "test_plugin.py").write_text(
+        """
+from nitro_dispatch import PluginBase, hook
+
+class DiscoveredPlugin(PluginBase):
+    name = "discovered"
+    version = "1.0.0"
+
+    @hook('test_event')
+    def test_hook(self, data):
+        return data
+"""
+    )
+
+    recursive = root / "recursive"
+    (recursive / "subdir").mkdir(parents=True)
+    (recursive / "subdir" / "sub_plugin.py").write_text(
+        """
+from nitro_dispatch import PluginBase
+
+class SubPlugin(PluginBase):
+    name = "sub_plugin"
+"""
+    )
+
+    invalid = root / "invalid"
+    (invalid / "subdir").mkdir(parents=True)
+    (invalid / "readme.txt").write_text("Not a plugin")
+    (invalid / "valid_plugin.py").write_text(
+        """
+from nitro_dispatch import PluginBase
+
+class ValidPlugin(PluginBase):
+    name = "valid"
+"""
+    )
+
+    broken = root / "broken"
+    broken.mkdir()
+    (broken / "broken_plugin.py").write_text(
+        """
+from nitro_dispatch import PluginBase
+
+class BrokenPlugin(PluginBase):
+    name = "broken"
+    raise SyntaxError("Broken")  # This will cause an error
+"""
+    )
+    (broken / "good_plugin.py").write_text(
+        """
+from nitro_dispatch import PluginBase
+
+class GoodPlugin(PluginBase):
+    name = "good"
+"""
+    )
+
+    dir_matches = root / "dir_matches"
+    # A directory that matches the pattern, next to a real plugin file.
+    (dir_matches / "not_a_plugin.py").mkdir(parents=True)
+    (dir_matches / "valid.py").write_text(
+        """
+from nitro_dispatch import PluginBase
+
+class ValidPlugin(PluginBase):
+    name = "valid"
+"""
+    )
+
+    return DiscoveryCorpus(basic, recursive, invalid, broken, dir_matches)
@@ -146,3 +146,34 @@ def test_auto_collect_hooks():
     # Hooks should be stored in _hooks dict
     assert "event1" in plugin._hooks
     assert "event2" in plugin._hooks
+
+
+def test_hook_decorator_returns_original_function():
+    """Test that the decorator stamps metadata without wrapping."""
+
+    def process(self, data):
+        return data
+
+    async def fetch(self, data):
+        return data
+
+    assert hook("test_event")(process) is process
+    assert hook("test_event")(fetch) is fetch
+    assert process._hook_meta == ("test_event", 50, None, False, False)
+
+
+def test_hook_decorator_forced_async_wraps():
+    """Test async_hook=True turns a plain awaitable-returning function async."""
+
+    async def real(data):
+        data["awaited"] = True
+        return data
+
+    def deferred(self, data):
+        return real(data)
+
+    wrapped = hook("test_event", async_hook=True)(deferred)
+
+    assert wrapped is not deferred
+    assert asyncio.iscoroutinefunction(wrapped)
+    assert asyncio.run(wrapped(None, {})) == {"awaited": True}
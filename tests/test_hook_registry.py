@@ -4,8 +4,10 @@ Tests for HookRegistry class.
 
 import pytest
 import asyncio
+import sys
+import threading
 import time
-from nitro_dispatch.core.hook_registry import HookRegistry
+from nitro_dispatch.core.hook_registry import _COMPILE_THRESHOLD, HookRegistry
 from nitro_dispatch.core.exceptions import HookError, StopPropagation
 from nitro_dispatch import PluginBase
 
@@ -120,7 +122,7 @@ async def test_trigger_async_hooks(registry):
 
     async def async_callback(data):
         called.append("async")
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         data["async"] = True
         return data
 
@@ -144,7 +146,7 @@ async def test_trigger_async_mixed_hooks(registry):
 
     async def async_callback(data):
         called.append("async")
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         data["async"] = True
         return data
 
@@ -221,16 +223,20 @@ def test_stop_propagation(registry):
 
 def test_hook_timeout(registry):
     """Test hook timeout protection."""
+    release = threading.Event()
 
     def slow_callback(data):
-        time.sleep(3)  # Exceeds timeout
+        release.wait(3)  # Exceeds timeout
         return data
 
     registry.register("test_event", slow_callback, timeout=0.1)
     registry.set_error_strategy("fail_fast")
 
-    with pytest.raises(HookError):
-        registry.trigger("test_event", {})
+    try:
+        with pytest.raises(HookError):
+            registry.trigger("test_event", {})
+    finally:
+        release.set()
 
 
 def test_error_strategy_log_and_continue(registry, mock_plugin):
@@ -540,6 +546,28 @@ async def test_async_disabled_plugin_skipped(registry, mock_plugin):
     assert "should_not_run" not in result
 
 
+@pytest.mark.asyncio
+async def test_async_inline_sync_hooks_run_on_loop_thread():
+    """With inline_sync_hooks, untimed sync hooks skip the executor."""
+
+    registry = HookRegistry(inline_sync_hooks=True)
+
+    def untimed(data):
+        data["untimed"] = threading.current_thread()
+        return data
+
+    def timed(data):
+        data["timed"] = threading.current_thread()
+        return data
+
+    registry.register("test_event", untimed, priority=100)
+    registry.register("test_event", timed, priority=50, timeout=1.0)
+
+    result = await registry.trigger_async("test_event", {})
+    assert result["untimed"] is threading.current_thread()
+    assert result["timed"] is not threading.current_thread()
+
+
 @pytest.mark.asyncio
 async def test_async_stop_propagation(registry):
     """Test StopPropagation in async hooks."""
@@ -626,24 +654,29 @@ def test_timeout_with_on_error_failing(registry):
 
     plugin = FailingOnErrorPlugin()
     plugin.enabled = True
+    release = threading.Event()
 
     def slow_callback(data):
-        time.sleep(3)
+        release.wait(3)
         return data
 
     registry.set_error_strategy("log_and_continue")
     registry.register("test_event", slow_callback, plugin, timeout=0.1)
 
     # Should handle both timeout and on_error exception
-    result = registry.trigger("test_event", {})
+    try:
+        result = registry.trigger("test_event", {})
+    finally:
+        release.set()
     assert result == {}
 
 
 def test_timeout_collect_all_strategy(registry, mock_plugin):
     """Test timeout with collect_all error strategy."""
+    release = threading.Event()
 
     def slow_callback(data):
-        time.sleep(3)
+        release.wait(3)
         return data
 
     mock_plugin.enabled = True
@@ -651,7 +684,10 @@ def test_timeout_collect_all_strategy(registry, mock_plugin):
     registry.register("test_event", slow_callback, mock_plugin, timeout=0.1)
 
     # Should collect timeout error and continue
-    result = registry.trigger("test_event", {})
+    try:
+        result = registry.trigger("test_event", {})
+    finally:
+        release.set()
     assert result == {}
 
 
@@ -710,3 +746,977 @@ async def test_async_error_fail_fast_strategy(registry, mock_plugin):
     # Should raise HookError
     with pytest.raises(HookError):
         await registry.trigger_async("test_event", {})
+
+
+def test_wildcard_trie_matching(registry):
+    """Test wildcard patterns at different depths of the segment trie."""
+
+    def make_callback(tag):
+        def callback(data):
+            data.setdefault("matched", []).append(tag)
+            return data
+
+        return callback
+
+    registry.register("*", make_callback("any"), priority=100)
+    registry.register("user.*", make_callback("user"), priority=90)
+    registry.register("app.*.save", make_callback("save"), priority=80)
+
+    assert registry.trigger("user.login", {})["matched"] == ["any", "user"]
+    assert registry.trigger("app.db.save", {})["matched"] == ["any", "save"]
+    # "user.*" requires at least one segment after "user."
+    assert registry.trigger("user", {})["matched"] == ["any"]
+
+
+def test_resolution_cache_invalidated_on_change(registry):
+    """Test that cached hook resolutions reflect later registrations."""
+
+    def callback(data):
+        return data
+
+    registry.register("user.*", callback)
+    assert len(registry.get_hooks("user.login")) == 1
+
+    registry.register("user.login", callback)
+    assert len(registry.get_hooks("user.login")) == 2
+
+    registry.unregister("user.*", callback)
+    assert len(registry.get_hooks("user.login")) == 1
+
+    registry.clear_all()
+    assert registry.get_hooks("user.login") == []
+
+
+def test_equal_priority_keeps_registration_order(registry):
+    """Test that ties run in registration order across exact and wildcard hooks."""
+    called = []
+
+    def make_callback(tag):
+        def callback(data):
+            called.append(tag)
+            return data
+
+        return callback
+
+    registry.register("user.login", make_callback("first"))
+    registry.register("user.*", make_callback("second"))
+    registry.register("user.login", make_callback("third"))
+    registry.register("user.login", make_callback("urgent"), priority=100)
+
+    registry.trigger("user.login", {})
+    assert called == ["urgent", "first", "second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_trigger_async_parallel_hooks(registry):
+    """Test same-priority parallel async hooks run concurrently."""
+    first_started = asyncio.Event()
+    second_started = asyncio.Event()
+    called = []
+
+    async def first(data):
+        first_started.set()
+        await asyncio.wait_for(second_started.wait(), timeout=1)
+        called.append("first")
+        return {"ignored": True}
+
+    async def second(data):
+        second_started.set()
+        await asyncio.wait_for(first_started.wait(), timeout=1)
+        called.append("second")
+
+    async def after(data):
+        called.append("after")
+        data["after"] = True
+        return data
+
+    registry.register("test_event", first, parallel=True)
+    registry.register("test_event", second, parallel=True)
+    registry.register("test_event", after, priority=10)
+
+    result = await registry.trigger_async("test_event", {})
+
+    assert sorted(called[:2]) == ["first", "second"]
+    assert called[2] == "after"
+    assert result == {"after": True}
+
+
+@pytest.mark.asyncio
+async def test_trigger_async_parallel_stop_propagation(registry):
+    """Test StopPropagation from a parallel hook halts lower tiers."""
+    called = []
+
+    async def stopper(data):
+        raise StopPropagation("halt")
+
+    async def sibling(data):
+        called.append("sibling")
+
+    async def later(data):
+        called.append("later")
+
+    registry.register("test_event", stopper, parallel=True)
+    registry.register("test_event", sibling, parallel=True)
+    registry.register("test_event", later, priority=10)
+
+    await registry.trigger_async("test_event", {})
+
+    assert called == ["sibling"]
+
+
+def test_enabled_mask_tracks_plugin_state(registry, mock_plugin):
+    """Test enable/disable is honored for PluginBase and duck-typed plugins."""
+
+    class DuckPlugin:
+        name = "duck"
+        enabled = True
+
+    duck = DuckPlugin()
+    called = []
+
+    registry.register("test_event", lambda d: called.append("mock"), mock_plugin)
+    registry.register("test_event", lambda d: called.append("duck"), duck)
+    registry.register("test_event", lambda d: called.append("anonymous"))
+
+    mock_plugin.enabled = True
+    registry.trigger("test_event", {})
+    assert called == ["mock", "duck", "anonymous"]
+
+    called.clear()
+    mock_plugin.enabled = False
+    duck.enabled = False
+    registry.trigger("test_event", {})
+    assert called == ["anonymous"]
+
+
+def test_enabled_mask_bits_recycled(registry, mock_plugin):
+    """Test a plugin's mask bit is released once its last hook is removed."""
+
+    def callback(data):
+        return data
+
+    registry.register("test_event", callback, mock_plugin)
+    registry.register("other_event", callback, mock_plugin)
+    bit = registry.get_hooks("test_event")[0]["bit"]
+
+    registry.unregister("test_event", callback, mock_plugin)
+    assert id(mock_plugin) in registry._plugin_bits
+
+    registry.clear_event("other_event")
+    assert id(mock_plugin) not in registry._plugin_bits
+    assert bit in registry._free_bits
+
+
+def test_event_names_interned(registry):
+    """Test registered event names are interned."""
+    event_name = "".join(["user.", "login"])
+    registry.register(event_name, lambda d: d)
+
+    (stored,) = registry.get_all_events()
+    assert stored is sys.intern("user.login")
+
+
+def test_trigger_passes_payload_by_reference(registry):
+    """Test hooks share the caller's payload object rather than copies."""
+    payload = {}
+    seen = []
+
+    def mutate(data):
+        seen.append(data)
+        data["touched"] = True
+
+    def observe(data):
+        seen.append(data)
+        return data
+
+    registry.register("test_event", mutate, priority=100)
+    registry.register("test_event", observe)
+
+    result = registry.trigger("test_event", payload)
+
+    assert result is payload
+    assert all(data is payload for data in seen)
+    assert payload == {"touched": True}
+
+
+def test_wildcard_matcher_shapes(registry):
+    """Test prefix, suffix, infix and multi-star wildcard remainders."""
+
+    def callback(data):
+        return data
+
+    registry.register("db.before_*", callback)
+    registry.register("app.*_saved", callback)
+    registry.register("job.run*ing", callback)
+    registry.register("svc.*.*.done", callback)
+
+    assert len(registry.get_hooks("db.before_save")) == 1
+    assert len(registry.get_hooks("db.after_save")) == 0
+    assert len(registry.get_hooks("app.user_saved")) == 1
+    assert len(registry.get_hooks("app.user_loaded")) == 0
+    assert len(registry.get_hooks("job.running")) == 1
+    assert len(registry.get_hooks("job.ring")) == 0
+    assert len(registry.get_hooks("svc.a.b.done")) == 1
+    assert len(registry.get_hooks("svc.a.done")) == 0
+
+
+def test_register_uses_decorator_async_flag(registry):
+    """Test is_async comes from @hook metadata when available."""
+    from nitro_dispatch import hook
+
+    async def real(data):
+        return data
+
+    @hook("test_event", async_hook=True)
+    def deferred(data):
+        return real(data)
+
+    def plain(data):
+        return data
+
+    plain._hook_meta = ("test_event", 50, None, True, False)
+
+    registry.register("test_event", plain)
+    registry.register("test_event", deferred)
+
+    assert [h["is_async"] for h in registry.get_hooks("test_event")] == [True, True]
+
+
+def test_register_detects_async_partials_and_methods(registry):
+    """Test coroutine detection sees through partials and bound methods."""
+    import functools
+
+    async def handler(data, tag):
+        return data
+
+    class Service:
+        async def handle(self, data):
+            return data
+
+        def handle_sync(self, data):
+            return data
+
+    service = Service()
+    registry.register("test_event", functools.partial(handler, tag="x"))
+    registry.register("test_event", service.handle)
+    registry.register("test_event", service.handle_sync)
+
+    assert [h["is_async"] for h in registry.get_hooks("test_event")] == [True, True, False]
+
+
+def test_timed_hooks_share_worker_pool(registry):
+    """Test timed sync hooks run on one reused pool and timeouts return promptly."""
+    release = threading.Event()
+    threads = []
+
+    def blocked(data):
+        release.wait(5)
+
+    def quick(data):
+        threads.append(threading.current_thread().name)
+        return data
+
+    registry.register("slow_event", blocked, timeout=0.05)
+    registry.register("fast_event", quick, timeout=1.0)
+
+    try:
+        start = time.monotonic()
+        registry.trigger("slow_event", {})
+        assert time.monotonic() - start < 1
+
+        pool = registry._timeout_pool
+        registry.trigger("fast_event", {})
+        registry.trigger("fast_event", {})
+        assert registry._timeout_pool is pool
+        assert all(name.startswith("nitro-hook") for name in threads)
+    finally:
+        release.set()
+
+
+def test_timed_hook_fails_fast_when_pool_saturated(registry, monkeypatch):
+    """Test stuck timed hooks make later ones fail fast instead of queueing or spawning."""
+    from nitro_dispatch.core import hook_registry
+
+    monkeypatch.setattr(hook_registry, "_TIMEOUT_POOL_SIZE", 2)
+    release = threading.Event()
+    ran = []
+
+    def stuck(data):
+        release.wait(5)
+
+    def healthy(data):
+        ran.append(threading.current_thread().name)
+        return data
+
+    registry.register("stuck_event", stuck, timeout=0.05)
+    registry.register("healthy_event", healthy, timeout=1.0)
+    registry.set_error_strategy("fail_fast")
+
+    try:
+        for _ in range(2):
+            with pytest.raises(HookError):
+                registry.trigger("stuck_event", {})
+        threads_before = threading.active_count()
+
+        start = time.monotonic()
+        with pytest.raises(HookError, match="workers are still busy"):
+            registry.trigger("healthy_event", {})
+        assert time.monotonic() - start < 0.5
+        assert threading.active_count() == threads_before
+
+        release.set()
+        for _ in range(100):
+            if registry._timeout_busy == 0:
+                break
+            time.sleep(0.01)
+        assert registry.trigger("healthy_event", {}) == {}
+        assert len(ran) == 1 and ran[0].startswith("nitro-hook")
+    finally:
+        release.set()
+        registry.close()
+
+
+def test_hook_tracing_buffer(registry):
+    """Test tracing records into a buffer that get_trace() drains."""
+
+    def callback(data):
+        return data
+
+    registry.register("test_event", callback, priority=70)
+    assert registry.get_trace() == []
+
+    registry.enable_hook_tracing(True)
+    registry.trigger("test_event", {})
+    registry.trigger("test_event", {})
+    registry.enable_hook_tracing(False)
+    registry.trigger("test_event", {})
+
+    lines = registry.get_trace()
+    assert len(lines) == 2
+    assert lines[0].startswith("Hook 'test_event' from 'anonymous' (priority=70) executed in ")
+    assert registry.get_trace() == []
+
+
+def test_generated_dispatcher_matches_loop(registry, mock_plugin):
+    """Test the generated dispatcher and the traced loop behave the same."""
+
+    def add(tag):
+        def callback(data):
+            data.append(tag)
+            return data
+
+        return callback
+
+    def failing(data):
+        raise ValueError("boom")
+
+    def stopper(data):
+        data.append("stop")
+        raise StopPropagation()
+
+    async def async_callback(data):
+        data.append("async")
+
+    registry.set_error_strategy("collect_all")
+    registry.register("test_event", add("first"), priority=100)
+    registry.register("test_event", failing, priority=90)
+    registry.register("test_event", async_callback, priority=80)
+    registry.register("test_event", add("timed"), priority=70, timeout=1.0)
+    registry.register("test_event", add("plugin"), mock_plugin, priority=60)
+    registry.register("test_event", stopper, priority=50)
+    registry.register("test_event", add("never"), priority=40)
+
+    mock_plugin.enabled = True
+    expected = ["first", "timed", "plugin", "stop"]
+    for _ in range(_COMPILE_THRESHOLD - 1):
+        assert registry.trigger("test_event", []) == expected
+    assert "test_event" not in registry._dispatchers
+    assert registry.trigger("test_event", []) == expected
+    assert "test_event" in registry._dispatchers
+
+    registry.enable_hook_tracing(True)
+    assert registry.trigger("test_event", []) == expected
+    registry.enable_hook_tracing(False)
+
+    mock_plugin.enabled = False
+    assert registry.trigger("test_event", []) == ["first", "timed", "stop"]
+
+    registry.register("test_event", add("late"), priority=45)
+    assert "test_event" not in registry._dispatchers
+
+
+def test_resolution_cache_is_bounded(registry, monkeypatch):
+    """Test the resolution cache stores tuples and evicts the least recently used."""
+    import nitro_dispatch.core.hook_registry as hook_registry_module
+
+    monkeypatch.setattr(hook_registry_module, "_RESOLVE_CACHE_SIZE", 2)
+    registry.register("user.*", lambda d: d)
+
+    registry.trigger("user.a", {})
+    registry.trigger("user.b", {})
+    assert isinstance(registry._resolved["user.a"], tuple)
+
+    registry.trigger("user.a", {})
+    registry.trigger("user.c", {})
+    assert list(registry._resolved) == ["user.a", "user.c"]
+
+
+@pytest.mark.asyncio
+async def test_collect_all_summary_counts_errors(registry, caplog):
+    """Test collect_all reports how many hooks failed in one dispatch."""
+
+    def failing(data):
+        raise ValueError("boom")
+
+    async def async_failing(data):
+        raise ValueError("boom")
+
+    registry.set_error_strategy("collect_all")
+    registry.register("test_event", failing)
+    registry.register("test_event", failing, priority=10)
+    registry.register("async_event", async_failing)
+
+    with caplog.at_level("WARNING"):
+        registry.trigger("test_event", {})
+        await registry.trigger_async("async_event", {})
+
+    assert "Event 'test_event' completed with 2 errors" in caplog.text
+    assert "Async event 'async_event' completed with 1 errors" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_async_hook_own_timeout_error_not_converted(registry):
+    """Test a TimeoutError raised by the hook itself is not reported as a timeout."""
+
+    async def callback(data):
+        raise TimeoutError("upstream")
+
+    registry.set_error_strategy("fail_fast")
+    registry.register("test_event", callback, timeout=5.0)
+
+    with pytest.raises(HookError) as exc_info:
+        await registry.trigger_async("test_event", {})
+
+    assert type(exc_info.value.__cause__) is TimeoutError
+
+
+def test_timeout_error_subclass_logged_as_timeout(registry, caplog):
+    """Test subclasses of HookTimeoutError are still reported as timeouts."""
+    from nitro_dispatch.core.exceptions import HookTimeoutError
+
+    class UpstreamTimeout(HookTimeoutError):
+        pass
+
+    def callback(data):
+        raise UpstreamTimeout("upstream slow")
+
+    registry.register("test_event", callback)
+    with caplog.at_level("ERROR", logger="nitro_dispatch.core.hook_registry"):
+        registry.trigger("test_event", {})
+
+    assert caplog.records[-1].getMessage() == (
+        "Hook 'test_event' from plugin 'anonymous' timed out: upstream slow"
+    )
+
+
+def test_match_event_pattern_uses_compiled_regex(registry):
+    """Test the regex fallback treats dots literally and stars greedily."""
+    assert registry._match_event_pattern("a.*.*", "a.b.c")
+    assert registry._match_event_pattern("a.*", "a.b.c")
+    assert not registry._match_event_pattern("a.*", "abc")
+    assert not registry._match_event_pattern("a.*.*", "a.b")
+
+
+def test_wildcard_trie_pruned_on_clear(registry):
+    """Test clearing a wildcard pattern prunes its now-empty trie branch."""
+
+    def callback(data):
+        return data
+
+    registry.register("app.db.*", callback)
+    registry.register("app.*", callback)
+
+    registry.clear_event("app.db.*")
+    assert "db" not in registry._trie.children["app"].children
+    assert len(registry.get_hooks("app.db.save")) == 1
+
+    registry.clear_event("app.*")
+    assert registry._trie.children == {}
+
+
+def test_merged_resolution_order(registry):
+    """Test hooks from several matching lists merge into one priority order."""
+
+    def make_callback(tag):
+        def callback(data):
+            data.append(tag)
+            return data
+
+        return callback
+
+    registry.register("a.b", make_callback("exact-10"), priority=10)
+    registry.register("a.b", make_callback("exact-90"), priority=90)
+    registry.register("a.*", make_callback("a-50"), priority=50)
+    registry.register("*", make_callback("any-70"), priority=70)
+    registry.register("*", make_callback("any-10"), priority=10)
+
+    assert registry.trigger("a.b", []) == ["exact-90", "any-70", "a-50", "exact-10", "any-10"]
+
+
+def test_hook_info_record(registry, mock_plugin):
+    """Test get_hooks returns slotted records that still read like dicts."""
+    from nitro_dispatch.core.hook_registry import HookInfo
+
+    def callback(data):
+        return data
+
+    registry.register("test_event", callback, mock_plugin, priority=70, timeout=2.0)
+    (hook_info,) = registry.get_hooks("test_event")
+
+    assert isinstance(hook_info, HookInfo)
+    assert not hasattr(hook_info, "__dict__")
+    assert hook_info.priority == hook_info["priority"] == 70
+    assert hook_info["plugin_name"] == "mock"
+    assert hook_info.get("timeout") == 2.0
+    assert hook_info.get("missing", "default") == "default"
+    with pytest.raises(KeyError):
+        hook_info["missing"]
+
+    assert "priority" in hook_info
+    assert "missing" not in hook_info
+    assert list(hook_info) == list(hook_info.keys())
+    assert dict(hook_info) == {
+        "callback": callback,
+        "plugin": mock_plugin,
+        "plugin_name": "mock",
+        "priority": 70,
+        "timeout": 2.0,
+        "is_async": False,
+        "parallel": False,
+    }
+    assert dict(hook_info.items()) == dict(hook_info)
+
+
+def test_on_error_resolved_at_registration(registry, mock_plugin):
+    """Test the plugin's on_error handler is looked up once, at registration."""
+
+    def failing(data):
+        raise ValueError("boom")
+
+    def anonymous(data):
+        return data
+
+    registry.register("test_event", failing, mock_plugin)
+    registry.register("other_event", anonymous)
+
+    (hook_info,) = registry.get_hooks("test_event")
+    assert hook_info.on_error == mock_plugin.on_error
+    assert registry.get_hooks("other_event")[0].on_error is None
+
+    mock_plugin.enabled = True
+    registry.trigger("test_event", {})
+    assert mock_plugin.error_count == 1
+
+
+def test_trigger_batch(registry):
+    """Test trigger_batch runs every payload through the chain independently."""
+
+    def double(data):
+        if data == 0:
+            raise StopPropagation("zero")
+        return data * 2
+
+    def increment(data):
+        return data + 1
+
+    registry.register("test_event", double, priority=100)
+    registry.register("test_event", increment, priority=50)
+
+    assert registry.trigger_batch("test_event", [1, 0, 5]) == [3, 0, 11]
+    assert registry.trigger_batch("no_hooks", iter([1, 2])) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_trigger_batch_async(registry):
+    """Test trigger_batch_async matches trigger_async per payload."""
+
+    async def double(data):
+        return data * 2
+
+    def increment(data):
+        return data + 1
+
+    registry.register("test_event", double, priority=100)
+    registry.register("test_event", increment, priority=50)
+
+    assert await registry.trigger_batch_async("test_event", [1, 2, 3]) == [3, 5, 7]
+
+
+def test_wildcard_free_resolution_skips_trie(registry, monkeypatch):
+    """Test registries without wildcard patterns never walk the trie."""
+
+    def callback(data):
+        return data + 1
+
+    def fail(event_name):
+        raise AssertionError("trie walked")
+
+    registry.register("test_event", callback)
+    monkeypatch.setattr(registry, "_match_wildcards", fail)
+    assert registry.trigger("test_event", 1) == 2
+
+    monkeypatch.undo()
+    registry.register("test_*", callback)
+    assert registry.trigger("test_event", 1) == 3
+
+    registry.clear_event("test_*")
+    monkeypatch.setattr(registry, "_match_wildcards", fail)
+    assert registry.trigger("test_event", 1) == 2
+
+
+def test_unregister_in_place(registry):
+    """Test unregister edits the stored list and drops every duplicate."""
+
+    def keep(data):
+        return data
+
+    def drop(data):
+        return data
+
+    registry.register("test_event", drop, priority=90)
+    registry.register("test_event", keep, priority=50)
+    registry.register("test_event", drop, priority=10)
+    stored = registry._hooks["test_event"]
+
+    assert registry.unregister("test_event", drop) is True
+    assert registry._hooks["test_event"] is stored
+    assert [h.callback for h in registry.get_hooks("test_event")] == [keep]
+    assert registry.unregister("test_event", drop) is False
+
+
+@pytest.mark.asyncio
+async def test_dispatch_debug_logs_deferred(registry, mock_plugin, caplog):
+    """Test dispatch debug messages are lazily formatted yet still readable."""
+
+    def callback(data):
+        return data
+
+    registry.register("test_event", callback, mock_plugin)
+    with caplog.at_level("DEBUG", logger="nitro_dispatch.core.hook_registry"):
+        registry.trigger("missing_event", {})
+        await registry.trigger_async("test_event", {})
+
+    records = {record.getMessage(): record for record in caplog.records}
+    assert "No hooks registered for event 'missing_event'" in records
+    skipped = records["Skipping hook from disabled plugin 'mock'"]
+    assert skipped.args == ("mock",)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_info_and_warning_logs_deferred(registry, mock_plugin, caplog):
+    """Test stop-propagation and async-skip messages are formatted by logging."""
+
+    def stopper(data):
+        raise StopPropagation("enough")
+
+    async def async_callback(data):
+        return data
+
+    mock_plugin.enabled = True
+    registry.register("single_event", stopper, mock_plugin)
+    registry.register("mixed_event", stopper, mock_plugin, priority=10)
+    registry.register("mixed_event", async_callback, mock_plugin, priority=90)
+    with caplog.at_level("INFO", logger="nitro_dispatch.core.hook_registry"):
+        registry.trigger("single_event", {})
+        registry.trigger("mixed_event", {})
+        await registry.trigger_async("mixed_event", {})
+
+    stopped = "Hook propagation stopped by 'mock' for event '%s': enough"
+    assert [record.getMessage() for record in caplog.records] == [
+        stopped % "single_event",
+        "Skipping async hook 'mock' in sync trigger. Use trigger_async() instead.",
+        stopped % "mixed_event",
+        stopped % "mixed_event",
+    ]
+    assert all(record.args for record in caplog.records)
+
+    # Generated dispatchers log the same way once an event is hot.
+    registry.register("hot_event", stopper, mock_plugin, priority=90)
+    registry.register("hot_event", lambda data: data, mock_plugin)
+    caplog.clear()
+    with caplog.at_level("INFO", logger="nitro_dispatch.core.hook_registry"):
+        for _ in range(_COMPILE_THRESHOLD + 1):
+            registry.trigger("hot_event", {})
+    assert caplog.records[-1].getMessage() == stopped % "hot_event"
+    assert caplog.records[-1].args
+
+
+@pytest.mark.asyncio
+async def test_async_sync_hooks_use_supplied_executor():
+    """Test trigger_async runs sync hooks on the executor it was given."""
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(thread_name_prefix="custom-pool") as executor:
+        registry = HookRegistry(executor=executor)
+
+        def callback(data):
+            data["thread"] = threading.current_thread().name
+            return data
+
+        registry.register("test_event", callback)
+        result = await registry.trigger_async("test_event", {})
+
+    assert result["thread"].startswith("custom-pool")
+
+
+def test_has_hooks(registry):
+    """Test has_hooks sees exact and wildcard registrations."""
+
+    def callback(data):
+        return data
+
+    assert registry.has_hooks("user.login") is False
+
+    registry.register("user.login", callback)
+    assert registry.has_hooks("user.login") is True
+    assert registry.has_hooks("user.logout") is False
+
+    registry.register("user.*", callback)
+    assert registry.has_hooks("user.logout") is True
+    assert registry.has_hooks("order.created") is False
+
+    registry.clear_all()
+    assert registry.has_hooks("user.login") is False
+
+
+def test_register_many_matches_register(registry, monkeypatch):
+    """Test register_many orders hooks like register and invalidates once."""
+
+    def make_callback(tag):
+        def callback(data):
+            data.append(tag)
+            return data
+
+        return callback
+
+    registry.register("a.b", make_callback("existing-50"), priority=50)
+    registry.trigger("a.b", [])
+
+    invalidations = []
+    original = registry._invalidate
+    monkeypatch.setattr(registry, "_invalidate", lambda: invalidations.append(original()))
+
+    registry.register_many(
+        [
+            ("a.b", make_callback("batch-10"), None, 10, None, False),
+            ("a.b", make_callback("batch-90"), None, 90, None, False),
+            ("a.b", make_callback("batch-50"), None, 50, None, False),
+            ("a.*", make_callback("wild-70"), None, 70, None, False),
+        ]
+    )
+
+    assert len(invalidations) == 1
+    assert registry.trigger("a.b", []) == [
+        "batch-90",
+        "wild-70",
+        "existing-50",
+        "batch-50",
+        "batch-10",
+    ]
+    assert registry.has_hooks("a.c") is True
+
+    registry.register_many([])
+    assert len(invalidations) == 1
+
+
+def test_close_releases_timeout_pool(registry):
+    """Test close shuts down the timed-hook pool and a later hook recreates it."""
+
+    def callback(data):
+        data["ran"] = True
+        return data
+
+    registry.register("test_event", callback, timeout=1.0)
+    registry.trigger("test_event", {})
+    pool = registry._timeout_pool
+    assert pool is not None
+
+    registry.close()
+    assert registry._timeout_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(callback, {})
+
+    assert registry.trigger("test_event", {}) == {"ran": True}
+    assert registry._timeout_pool is not None
+    registry.close()
+    registry.close()
+
+
+@pytest.mark.asyncio
+async def test_unsubscribed_event_skips_resolution(registry, monkeypatch):
+    """Test events nobody listens to return before hook resolution, batches included."""
+
+    def fail(event_name):
+        raise AssertionError("resolution should be skipped")
+
+    registry.register("other_event", lambda d: d)
+    monkeypatch.setattr(registry, "_get_matching_hooks", fail)
+
+    payload = {"key": "value"}
+    assert registry.trigger("missing_event", payload) is payload
+    assert await registry.trigger_async("missing_event", payload) is payload
+    assert registry.trigger_batch("missing_event", [payload]) == [payload]
+    assert await registry.trigger_batch_async("missing_event", [payload]) == [payload]
+    assert "missing_event" not in registry._resolved
+
+
+def test_unregister_uses_index(registry, mock_plugin):
+    """Test unregister finds hooks by key, including fresh bound methods."""
+
+    class Listener:
+        def handle(self, data):
+            return data
+
+    class UnhashableCallback:
+        __hash__ = None
+
+        def __call__(self, data):
+            return data
+
+    listener = Listener()
+    unhashable = UnhashableCallback()
+    registry.register("test_event", listener.handle)
+    registry.register("test_event", listener.handle, mock_plugin)
+    registry.register("test_event", unhashable)
+
+    assert registry.unregister("test_event", Listener().handle) is False
+    assert registry.unregister("test_event", listener.handle) is True
+    assert [h.plugin for h in registry.get_hooks("test_event")] == [mock_plugin, None]
+
+    assert registry.unregister("test_event", unhashable) is True
+    assert registry.unregister("test_event", listener.handle, mock_plugin) is True
+    assert registry.get_hooks("test_event") == []
+    assert registry._hook_index["test_event"] == {}
+
+    registry.clear_event("test_event")
+    assert "test_event" not in registry._hook_index
+
+
+def test_wildcard_prefilter(registry):
+    """Test nodes with many wildcards prefilter with one combined regex."""
+    from nitro_dispatch.core.hook_registry import _PREFILTER_MIN
+
+    patterns = [f"*.kind{index}" for index in range(_PREFILTER_MIN)] + ["(odd*"]
+    for pattern in patterns:
+        registry.register(pattern, lambda d, pattern=pattern: d + [pattern])
+
+    assert registry._trie.prefilter is None
+    assert registry.trigger("user.kind1", []) == ["*.kind1"]
+    assert registry._trie.prefilter is not None
+    assert registry.trigger("user.other", []) == []
+    assert registry.trigger("(odd.kind2", []) == ["*.kind2", "(odd*"]
+
+    registry.clear_event("*.kind1")
+    assert registry._trie.prefilter is None
+    assert registry.trigger("user.kind1", []) == []
+    assert registry.trigger("user.kind3", []) == ["*.kind3"]
+
+
+def test_wildcard_prefilter_escapes_metacharacters(registry):
+    """Test prefiltered nodes treat regex metacharacters in patterns literally."""
+    from nitro_dispatch.core.hook_registry import _PREFILTER_MIN
+
+    patterns = ["*(1)", "*+x", "a[b]*c"] + [f"*_x{index}" for index in range(_PREFILTER_MIN)]
+    for pattern in patterns:
+        registry.register(pattern, lambda d, pattern=pattern: d + [pattern])
+
+    assert registry.trigger("a(1)", []) == ["*(1)"]
+    assert registry._trie.prefilter is not None
+    assert registry.trigger("a+x", []) == ["*+x"]
+    assert registry.trigger("a[b].c", []) == ["a[b]*c"]
+    assert registry.trigger("ab.c", []) == []
+    assert registry.trigger("a_x2", []) == ["*_x2"]
+
+
+def test_hook_error_logs_deferred(registry, caplog):
+    """Test hook error messages are %-formatted by logging, not up front."""
+
+    def failing(data):
+        raise ValueError("boom")
+
+    registry.set_error_strategy("collect_all")
+    registry.register("test_event", failing)
+    with caplog.at_level("WARNING", logger="nitro_dispatch.core.hook_registry"):
+        registry.trigger("test_event", {})
+
+    records = {record.getMessage(): record for record in caplog.records}
+    error = records["Error executing hook 'test_event' from plugin 'anonymous': boom"]
+    assert error.args[:3] == ("hook", "test_event", "anonymous")
+    summary = records["Event 'test_event' completed with 1 errors"]
+    assert summary.args == ("test_event", 1)
+
+    registry.set_error_strategy("fail_fast")
+    with pytest.raises(HookError, match="Error executing hook 'test_event' from plugin"):
+        registry.trigger("test_event", {})
+
+
+def test_single_hook_dispatcher(registry, mock_plugin):
+    """Test a lone sync hook gets a dispatcher on first trigger, with full semantics."""
+    calls = []
+
+    def callback(data):
+        calls.append(data)
+        if data == "stop":
+            raise StopPropagation()
+        if data == "fail":
+            raise ValueError("boom")
+        return data + "!"
+
+    mock_plugin.enabled = True
+    registry.register("test_event", callback, mock_plugin)
+
+    assert registry.trigger("test_event", "hi") == "hi!"
+    assert "test_event" in registry._dispatchers
+    assert registry.trigger("test_event", "stop") == "stop"
+    assert registry.trigger("test_event", "fail") == "fail"
+
+    registry.set_error_strategy("fail_fast")
+    with pytest.raises(HookError):
+        registry.trigger("test_event", "fail")
+
+    mock_plugin.enabled = False
+    assert registry.trigger("test_event", "hi") == "hi"
+    assert calls == ["hi", "stop", "fail", "fail"]
+
+
+@pytest.mark.asyncio
+async def test_returned_stop_propagation_sentinel(registry):
+    """Test returning the StopPropagation class halts every dispatch path."""
+    calls = []
+
+    def stopper(data):
+        calls.append("stop")
+        return StopPropagation
+
+    def later(data):
+        calls.append("later")
+        return "changed"
+
+    registry.register("single", stopper)
+    assert registry.trigger("single", "data") == "data"
+
+    registry.register("chain", stopper, priority=100)
+    registry.register("chain", later)
+    for _ in range(_COMPILE_THRESHOLD + 1):
+        assert registry.trigger("chain", "data") == "data"
+    assert "chain" in registry._dispatchers
+    assert await registry.trigger_async("chain", "data") == "data"
+
+    async def parallel_stopper(data):
+        return StopPropagation
+
+    registry.register("parallel", parallel_stopper, priority=100, parallel=True)
+    registry.register("parallel", later)
+    assert await registry.trigger_async("parallel", "data") == "data"
+
+    assert "later" not in calls
@@ -6,6 +6,8 @@ These tests verify that all components work together correctly.
 
 import pytest
 import asyncio
+import subprocess
+import sys
 from nitro_dispatch import PluginManager, PluginBase, hook, StopPropagation
 
 
@@ -55,9 +57,7 @@ def test_priority_based_data_filtering():
 
         @hook("process", priority=100)
         def process(self, data):
-            if "steps" not in data:
-                data["steps"] = []
-            data["steps"].append("high")
+            data.setdefault("steps", []).append("high")
             return data
 
     class MediumPriorityPlugin(PluginBase):
@@ -65,9 +65,7 @@ def test_priority_based_data_filtering():
 
         @hook("process", priority=50)
         def process(self, data):
-            if "steps" not in data:
-                data["steps"] = []
-            data["steps"].append("medium")
+            data.setdefault("steps", []).append("medium")
             return data
 
     class LowPriorityPlugin(PluginBase):
@@ -75,9 +73,7 @@ def test_priority_based_data_filtering():
 
         @hook("process", priority=10)
         def process(self, data):
-            if "steps" not in data:
-                data["steps"] = []
-            data["steps"].append("low")
+            data.setdefault("steps", []).append("low")
             return data
 
     manager = PluginManager()
@@ -156,7 +152,7 @@ async def test_async_and_sync_hooks_together():
 
         @hook("process", priority=50)
         async def process(self, data):
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             data["async"] = True
             return data
 
@@ -453,7 +449,7 @@ async def test_real_world_async_scenario():
 
         @hook("api_request", priority=100)
         async def authenticate(self, data):
-            await asyncio.sleep(0.01)  # Simulate auth check
+            await asyncio.sleep(0)  # Simulate auth check
             data["authenticated"] = True
             data["user_id"] = "user123"
             return data
@@ -463,7 +459,7 @@ async def test_real_world_async_scenario():
 
         @hook("api_request", priority=90)
         async def check_rate_limit(self, data):
-            await asyncio.sleep(0.01)  # Simulate rate limit check
+            await asyncio.sleep(0)  # Simulate rate limit check
             data["rate_limit_ok"] = True
             return data
 
@@ -487,3 +483,26 @@ async def test_real_world_async_scenario():
     assert result["user_id"] == "user123"
     assert result["rate_limit_ok"] is True
     assert result["logged"] is True
+
+
+def test_top_level_import_is_lazy():
+    """Test importing the package defers loading the core modules."""
+    code = (
+        "import sys, nitro_dispatch\n"
+        "assert 'nitro_dispatch.core.plugin_manager' not in sys.modules\n"
+        "from nitro_dispatch import PluginManager, HookError\n"
+        "assert PluginManager.__module__ == 'nitro_dispatch.core.plugin_manager'\n"
+        "assert 'PluginBase' in dir(nitro_dispatch)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_manager_import_defers_discovery_machinery():
+    """Test importlib.util is only imported once plugins are discovered from disk."""
+    code = (
+        "import sys, tempfile\n"
+        "from nitro_dispatch import PluginManager\n"
+        "assert 'importlib.util' not in sys.modules\n"
+        "PluginManager().discover_plugins(tempfile.mkdtemp())\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -271,3 +271,113 @@ def test_collect_hooks_with_property_error():
     # Should not raise despite the broken property
     plugin = TestPlugin()
     assert plugin.name == "test"
+
+
+def test_inherited_hooks_follow_overrides():
+    """Test subclass overrides replace or drop inherited decorated hooks."""
+
+    class BasePlugin(PluginBase):
+        name = "base"
+
+        @hook("event_a", priority=10)
+        def on_a(self, data):
+            return data
+
+        @hook("event_b")
+        def on_b(self, data):
+            return data
+
+    class ChildPlugin(BasePlugin):
+        name = "child"
+
+        @hook("event_a", priority=90)
+        def on_a(self, data):
+            return data
+
+        def on_b(self, data):
+            return data
+
+    plugin = ChildPlugin()
+    assert list(plugin._hooks) == ["event_a"]
+    assert plugin._hooks["event_a"][0]["priority"] == 90
+    assert plugin._hooks["event_a"][0]["callback"].__self__ is plugin
+    assert "event_b" in BasePlugin()._hooks
+
+
+def test_legacy_hook_attributes_collected():
+    """Test methods marked with the original _is_hook attributes still register."""
+
+    def legacy_hook(event_name, priority=50):
+        def decorator(func):
+            func._is_hook = True
+            func._event_name = event_name
+            func._priority = priority
+            return func
+
+        return decorator
+
+    class LegacyPlugin(PluginBase):
+        name = "legacy"
+
+        @legacy_hook("legacy_event", priority=70)
+        def handle(self, data):
+            return data
+
+        @legacy_hook("legacy_event")
+        async def handle_async(self, data):
+            return data
+
+    plugin = LegacyPlugin()
+    hooks = plugin._hooks["legacy_event"]
+    assert [(h["callback"].__name__, h["priority"], h["timeout"]) for h in hooks] == [
+        ("handle", 70, None),
+        ("handle_async", 50, None),
+    ]
+    assert dict(LegacyPlugin._hook_specs)["handle_async"][3] is True
+
+
+def test_fully_slotted_plugin():
+    """Test a subclass declaring __slots__ loads and dispatches without a __dict__."""
+    from nitro_dispatch import PluginManager
+
+    class SlottedPlugin(PluginBase):
+        __slots__ = ("hits",)
+        name = "slotted"
+
+        def __init__(self):
+            super().__init__()
+            self.hits = 0
+
+        @hook("test_event")
+        def count(self, data):
+            self.hits += 1
+            return data
+
+    manager = PluginManager()
+    manager.register(SlottedPlugin)
+    plugin = manager.load("slotted")
+    manager.trigger("test_event", {})
+
+    assert not hasattr(plugin, "__dict__")
+    assert plugin.hits == 1
+
+
+def test_plugin_keeps_manager_alive():
+    """Test a loaded plugin keeps working after the caller drops its manager."""
+    from nitro_dispatch import PluginManager
+
+    class TestPlugin(PluginBase):
+        name = "test"
+
+        @hook("event")
+        def on_event(self, data):
+            data["seen"] = True
+            return data
+
+    manager = PluginManager(config={"test": {"key": "value"}})
+    manager.register(TestPlugin)
+    plugin = manager.load("test")
+    del manager
+
+    assert plugin.get_config("key") == "value"
+    assert plugin.trigger("event", {}) == {"seen": True}
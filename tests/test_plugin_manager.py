@@ -2,6 +2,7 @@
 Tests for PluginManager class.
 """
 
+import os
 import pytest
 import tempfile
 import asyncio
@@ -47,6 +48,22 @@ def test_manager_initialization():
     assert manager._loaded is False
 
 
+def test_manager_is_slotted():
+    """Test PluginManager instances carry no __dict__ but stay weak-referenceable."""
+    import weakref
+
+    manager = PluginManager()
+    assert not hasattr(manager, "__dict__")
+    assert weakref.ref(manager)() is manager
+
+    class CustomManager(PluginManager):
+        pass
+
+    custom = CustomManager()
+    custom.extra = "allowed"
+    assert custom.extra == "allowed"
+
+
 def test_manager_with_config():
     """Test PluginManager with configuration."""
     config = {"plugin1": {"key": "value"}}
@@ -80,11 +97,15 @@ def test_register_plugin_without_name(manager):
     assert "MyPlugin" in manager.get_registered_plugins()
 
 
-def test_register_duplicate_plugin(manager, sample_plugin):
+def test_register_duplicate_plugin(manager, sample_plugin, caplog):
     """Test registering the same plugin twice."""
     manager.register(sample_plugin)
-    manager.register(sample_plugin)  # Should warn but not fail
+    with caplog.at_level("WARNING", logger="nitro_dispatch.core.plugin_manager"):
+        manager.register(sample_plugin)  # Should warn but not fail
     assert "sample" in manager.get_registered_plugins()
+    warning = caplog.records[-1]
+    assert warning.getMessage() == "Plugin 'sample' is already registered. Overwriting."
+    assert warning.args == ("sample",)
 
 
 def test_unregister_plugin(manager, sample_plugin):
@@ -218,7 +239,7 @@ async def test_trigger_async_event(manager):
 
         @hook("async_event")
         async def async_hook(self, data):
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             data["async"] = True
             return data
 
@@ -328,32 +349,62 @@ def test_metadata_validation_disabled(manager):
     manager_no_validation.register(InvalidPlugin, validate=False)
 
 
-def test_plugin_discovery(manager):
+def test_plugin_discovery(manager, discovery_corpus):
     """Test plugin discovery from directory."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        plugin_dir = Path(temp_dir)
-
-        # Create a plugin file
-        plugin_content = """
-from nitro_dispatch import PluginBase, hook
-
-class DiscoveredPlugin(PluginBase):
-    name = "discovered"
-    version = "1.0.0"
+    discovered = manager.discover_plugins(discovery_corpus.basic, pattern="*_plugin.py")
 
-    @hook('test_event')
-    def test_hook(self, data):
-        return data
-"""
-        plugin_file = plugin_dir / "test_plugin.py"
-        plugin_file.write_text(plugin_content)
+    assert "discovered" in discovered
+    # Discovered but not loaded
+    assert manager.is_loaded("discovered") is False
 
-        # Discover plugins
-        discovered = manager.discover_plugins(plugin_dir, pattern="*_plugin.py")
 
-        assert "discovered" in discovered
-        # Discovered but not loaded
-        assert manager.is_loaded("discovered") is False
+def test_plugin_discovery_reuses_unchanged_modules():
+    """Test re-discovery reuses cached modules until the file changes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plugin_file = Path(temp_dir) / "cached_plugin.py"
+        plugin_file.write_text(
+            "from nitro_dispatch import PluginBase\n\n"
+            "class CachedPlugin(PluginBase):\n"
+            "    name = 'cached'\n"
+        )
+
+        first, second, third = PluginManager(), PluginManager(), PluginManager()
+        first.discover_plugins(temp_dir)
+        second.discover_plugins(temp_dir)
+        assert first._plugin_classes["cached"] is second._plugin_classes["cached"]
+
+        stat = plugin_file.stat()
+        os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        third.discover_plugins(temp_dir)
+        assert third._plugin_classes["cached"] is not first._plugin_classes["cached"]
+
+
+def test_plugin_discovery_detects_same_mtime_rewrite():
+    """Test a rewrite that keeps the mtime but changes the size is re-executed."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plugin_file = Path(temp_dir) / "stamped_plugin.py"
+        plugin_file.write_text(
+            "from nitro_dispatch import PluginBase\n\n"
+            "class StampedPlugin(PluginBase):\n"
+            "    name = 'stamped'\n"
+        )
+        first = PluginManager()
+        first.discover_plugins(temp_dir)
+        original = first._plugin_classes["stamped"]
+
+        stat = plugin_file.stat()
+        plugin_file.write_text(
+            "from nitro_dispatch import PluginBase\n\n"
+            "class StampedPlugin(PluginBase):\n"
+            "    name = 'stamped'\n"
+            "    version = '2.0.0'\n"
+        )
+        os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        second = PluginManager()
+        second.discover_plugins(temp_dir)
+        assert second._plugin_classes["stamped"] is not original
+        assert second._plugin_classes["stamped"].version == "2.0.0"
 
 
 def test_plugin_discovery_nonexistent_dir(manager):
@@ -362,27 +413,11 @@ def test_plugin_discovery_nonexistent_dir(manager):
         manager.discover_plugins("/nonexistent/directory")
 
 
-def test_plugin_discovery_recursive(manager):
+def test_plugin_discovery_recursive(manager, discovery_corpus):
     """Test recursive plugin discovery."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        plugin_dir = Path(temp_dir)
-        sub_dir = plugin_dir / "subdir"
-        sub_dir.mkdir()
+    discovered = manager.discover_plugins(discovery_corpus.recursive, recursive=True)
 
-        # Create plugin in subdirectory
-        plugin_content = """
-from nitro_dispatch import PluginBase
-
-class SubPlugin(PluginBase):
-    name = "sub_plugin"
-"""
-        plugin_file = sub_dir / "sub_plugin.py"
-        plugin_file.write_text(plugin_content)
-
-        # Discover recursively
-        discovered = manager.discover_plugins(plugin_dir, recursive=True)
-
-        assert "sub_plugin" in discovered
+    assert "sub_plugin" in discovered
 
 
 def test_reload_plugin(manager, sample_plugin):
@@ -453,6 +488,43 @@ class ReloadablePlugin(PluginBase):
             sys.modules.pop("reloadable_plugin", None)
 
 
+def test_reload_skips_unchanged_module(manager):
+    """Test reload() only re-executes a module whose file changed since last time."""
+    import sys
+    import importlib
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plugin_dir = Path(temp_dir)
+        plugin_file = plugin_dir / "steady_plugin.py"
+        plugin_file.write_text(
+            "from nitro_dispatch import PluginBase\n\n"
+            "class SteadyPlugin(PluginBase):\n    name = 'steady'\n"
+        )
+
+        sys.path.insert(0, str(plugin_dir))
+        try:
+            original = importlib.import_module("steady_plugin").SteadyPlugin
+            manager.register(original)
+            manager.load("steady")
+
+            # No mtime on record yet, so the first reload re-executes.
+            manager.reload("steady")
+            first = manager._plugin_classes["steady"]
+            assert first is not original
+
+            manager.reload("steady")
+            assert manager._plugin_classes["steady"] is first
+            assert manager.is_loaded("steady")
+
+            future = plugin_file.stat().st_mtime + 2
+            os.utime(plugin_file, (future, future))
+            manager.reload("steady")
+            assert manager._plugin_classes["steady"] is not first
+        finally:
+            sys.path.remove(str(plugin_dir))
+            sys.modules.pop("steady_plugin", None)
+
+
 @pytest.mark.asyncio
 async def test_trigger_async_sync_hook_with_timeout(manager):
     """Regression: a sync hook with a timeout must work under trigger_async().
@@ -463,7 +535,9 @@ async def test_trigger_async_sync_hook_with_timeout(manager):
     fail unconditionally (never timing out, just erroring) on POSIX, and fail
     on Windows regardless.
     """
-    import time
+    import threading
+
+    release = threading.Event()
 
     class FastSyncPlugin(PluginBase):
         name = "fast_sync"
@@ -484,7 +558,7 @@ async def test_trigger_async_sync_hook_with_timeout(manager):
 
         @hook("slow_event", timeout=0.1)
         def slow(self, data):
-            time.sleep(1.0)
+            release.wait(1.0)
             return data
 
     manager.register(SlowSyncPlugin)
@@ -493,8 +567,11 @@ async def test_trigger_async_sync_hook_with_timeout(manager):
 
     from nitro_dispatch.core.exceptions import HookError
 
-    with pytest.raises(HookError):
-        await manager.trigger_async("slow_event", {})
+    try:
+        with pytest.raises(HookError):
+            await manager.trigger_async("slow_event", {})
+    finally:
+        release.set()
 
 
 def test_set_error_strategy(manager):
@@ -535,6 +612,19 @@ def test_get_all_plugins(manager, sample_plugin):
     assert "plugin2" in all_plugins
 
 
+def test_get_all_plugins_is_read_only_view(manager, sample_plugin):
+    """Test get_all_plugins returns a live mapping that cannot be mutated."""
+    all_plugins = manager.get_all_plugins()
+    assert len(all_plugins) == 0
+
+    manager.register(sample_plugin)
+    manager.load("sample")
+    assert all_plugins["sample"] is manager.get_plugin("sample")
+
+    with pytest.raises(TypeError):
+        all_plugins["other"] = None
+
+
 def test_lifecycle_hooks_called(manager):
     """Test that lifecycle hooks are called."""
 
@@ -582,6 +672,25 @@ def test_log_level_configuration():
     assert manager_warning is not None
 
 
+def test_log_level_skips_configured_root_logger(monkeypatch):
+    """Test basicConfig is only called while the root logger has no handlers."""
+    import logging
+
+    calls = []
+    monkeypatch.setattr(logging, "basicConfig", lambda **kwargs: calls.append(kwargs))
+
+    monkeypatch.setattr(logging.root, "handlers", [logging.NullHandler()])
+    PluginManager(log_level="DEBUG")
+    assert calls == []
+    with pytest.raises(AttributeError):
+        PluginManager(log_level="bogus")
+
+    monkeypatch.setattr(logging.root, "handlers", [])
+    PluginManager(log_level="DEBUG")
+    PluginManager(log_level="warn")
+    assert calls == [{"level": logging.DEBUG}, {"level": logging.WARNING}]
+
+
 def test_validation_invalid_version(manager):
     """Test validation with invalid version."""
 
@@ -684,67 +793,20 @@ def test_unload_all_with_errors(manager):
     assert manager.is_loaded("good") is False
 
 
-def test_plugin_discovery_with_invalid_files(manager):
+def test_plugin_discovery_with_invalid_files(manager, discovery_corpus):
     """Test plugin discovery with non-Python files and directories."""
-    import tempfile
-    from pathlib import Path
+    # Discovery should skip non-Python files and directories
+    discovered = manager.discover_plugins(discovery_corpus.invalid, pattern="*.py")
+    assert "valid" in discovered
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        plugin_dir = Path(temp_dir)
-
-        # Create a non-Python file
-        (plugin_dir / "readme.txt").write_text("Not a plugin")
-
-        # Create a subdirectory (not a file)
-        subdir = plugin_dir / "subdir"
-        subdir.mkdir()
-
-        # Create valid plugin file
-        plugin_content = """
-from nitro_dispatch import PluginBase
-
-class ValidPlugin(PluginBase):
-    name = "valid"
-"""
-        (plugin_dir / "valid_plugin.py").write_text(plugin_content)
 
-        # Discovery should skip non-Python files and directories
-        discovered = manager.discover_plugins(plugin_dir, pattern="*.py")
-        assert "valid" in discovered
-
-
-def test_plugin_discovery_with_broken_plugin(manager):
+def test_plugin_discovery_with_broken_plugin(manager, discovery_corpus):
     """Test plugin discovery when a plugin file has errors."""
-    import tempfile
-    from pathlib import Path
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        plugin_dir = Path(temp_dir)
-
-        # Create a broken plugin file
-        broken_content = """
-from nitro_dispatch import PluginBase
-
-class BrokenPlugin(PluginBase):
-    name = "broken"
-    raise SyntaxError("Broken")  # This will cause an error
-"""
-        (plugin_dir / "broken_plugin.py").write_text(broken_content)
-
-        # Create a good plugin
-        good_content = """
-from nitro_dispatch import PluginBase
-
-class GoodPlugin(PluginBase):
-    name = "good"
-"""
-        (plugin_dir / "good_plugin.py").write_text(good_content)
-
-        # Discovery should continue despite broken plugin
-        discovered = manager.discover_plugins(plugin_dir, pattern="*.py")
+    # Discovery should continue despite broken plugin
+    discovered = manager.discover_plugins(discovery_corpus.broken, pattern="*.py")
 
-        # Should discover the good plugin despite the broken one
-        assert "good" in discovered
+    # Should discover the good plugin despite the broken one
+    assert "good" in discovered
 
 
 def test_unregister_hook_method(manager, sample_plugin):
@@ -795,43 +857,369 @@ def test_old_format_hook_registration(manager):
     assert result["old"] is True
 
 
-def test_plugin_discovery_with_directory_in_results(manager):
+def test_plugin_discovery_with_directory_in_results(manager, discovery_corpus):
     """Test that directories are skipped during plugin discovery."""
+    # Discovery should skip the directory
+    discovered = manager.discover_plugins(discovery_corpus.dir_matches, pattern="*.py")
+    assert "valid" in discovered
+
+
+def test_plugin_discovery_overall_exception(manager):
+    """Test plugin discovery with overall exception."""
     import tempfile
     from pathlib import Path
+    from unittest import mock
 
     with tempfile.TemporaryDirectory() as temp_dir:
         plugin_dir = Path(temp_dir)
 
-        # Create a directory that matches the pattern
-        subdir = plugin_dir / "not_a_plugin.py"
-        subdir.mkdir()  # This is a directory, not a file
+        # Make the directory scan raise an exception
+        with mock.patch("os.scandir", side_effect=RuntimeError("Scan failed")):
+            with pytest.raises(PluginDiscoveryError) as exc_info:
+                manager.discover_plugins(plugin_dir, pattern="*.py")
+            assert "Plugin discovery failed" in str(exc_info.value)
+
+
+def test_register_reads_metadata_without_instantiating(manager, monkeypatch):
+    """Test register only instantiates plugins whose metadata needs it."""
+    created = []
+
+    class StaticPlugin(PluginBase):
+        name = "static"
+        version = "1.0.0"
+
+    class CustomInitPlugin(PluginBase):
+        name = "custom_init"
+        version = "2.0.0"
+
+        def __init__(self):
+            super().__init__()
+            created.append(self)
+
+    original_init = PluginBase.__init__
+    calls = []
+
+    def counting_init(self):
+        calls.append(type(self))
+        original_init(self)
+
+    monkeypatch.setattr(PluginBase, "__init__", counting_init)
+    manager.register(StaticPlugin)
+    monkeypatch.undo()
+    assert calls == []
+
+    manager.register(CustomInitPlugin)
+    manager.register(CustomInitPlugin)
+    assert len(created) == 1
+
+    manager.load("custom_init")
+    assert len(created) == 2
+    assert manager.get_plugin("custom_init").version == "2.0.0"
 
-        # Create a valid plugin
-        plugin_content = """
+
+def test_unload_only_touches_own_hooks(manager, monkeypatch):
+    """Test unload detaches a plugin's hooks via its index, not a registry scan."""
+
+    class FirstPlugin(PluginBase):
+        name = "first"
+
+        @hook("shared_event")
+        def handle(self, data):
+            data.append("first")
+            return data
+
+        def on_load(self):
+            self.register_hook("runtime_event", self.handle)
+
+    class SecondPlugin(PluginBase):
+        name = "second"
+
+        @hook("shared_event")
+        def handle(self, data):
+            data.append("second")
+            return data
+
+    manager.register(FirstPlugin)
+    manager.register(SecondPlugin)
+    manager.load_all()
+
+    def no_scan():
+        raise AssertionError("unload scanned every event")
+
+    monkeypatch.setattr(manager._registry, "get_all_events", no_scan)
+    manager.unload("first")
+
+    assert manager.trigger("shared_event", []) == ["second"]
+    assert manager._registry.get_hooks("runtime_event") == []
+    assert "first" not in manager._plugin_hooks
+
+
+def test_load_all_topological_order(manager):
+    """Test load_all loads dependencies first and reports cycles as failures."""
+
+    class AppPlugin(PluginBase):
+        name = "app"
+        dependencies = ["db", "cache"]
+
+    class CachePlugin(PluginBase):
+        name = "cache"
+        dependencies = ["db"]
+
+    class DbPlugin(PluginBase):
+        name = "db"
+
+    class PingPlugin(PluginBase):
+        name = "ping"
+        dependencies = ["pong"]
+
+    class PongPlugin(PluginBase):
+        name = "pong"
+        dependencies = ["ping"]
+
+    for plugin_class in (AppPlugin, CachePlugin, DbPlugin, PingPlugin, PongPlugin):
+        manager.register(plugin_class)
+
+    assert manager.load_all() == ["db", "cache", "app"]
+    assert not manager.is_loaded("ping")
+    assert not manager.is_loaded("pong")
+
+
+def test_load_circular_dependency(manager):
+    """Test load reports a dependency cycle instead of recursing forever."""
+
+    class PingPlugin(PluginBase):
+        name = "ping"
+        dependencies = ["pong"]
+
+    class PongPlugin(PluginBase):
+        name = "pong"
+        dependencies = ["ping"]
+
+    manager.register(PingPlugin)
+    manager.register(PongPlugin)
+
+    with pytest.raises(PluginLoadError, match="Circular dependency: ping -> pong -> ping"):
+        manager.load("ping")
+    assert not manager.is_loaded("ping")
+    assert not manager.is_loaded("pong")
+    assert manager._loading == {}
+
+
+def test_register_validates_each_class_once(manager, sample_plugin, monkeypatch):
+    """Test re-registering a class skips validation until it is unregistered."""
+    checked = []
+    original = PluginManager._validate_plugin_metadata
+
+    def counting_validate(self, name, version, dependencies):
+        checked.append(name)
+        original(self, name, version, dependencies)
+
+    monkeypatch.setattr(PluginManager, "_validate_plugin_metadata", counting_validate)
+
+    manager.register(sample_plugin)
+    manager.register(sample_plugin)
+    assert checked == ["sample"]
+
+    manager.unregister("sample")
+    manager.register(sample_plugin)
+    assert checked == ["sample", "sample"]
+
+
+def test_load_all_batch_events(manager):
+    """Test load_all can coalesce per-plugin loaded events into one batch event."""
+
+    class FirstPlugin(PluginBase):
+        name = "first"
+
+    class SecondPlugin(PluginBase):
+        name = "second"
+        version = "2.0.0"
+
+    loaded_events = []
+    batches = []
+    manager.register_hook(PluginManager.EVENT_PLUGIN_LOADED, loaded_events.append)
+    manager.register_hook(PluginManager.EVENT_PLUGINS_BATCH_LOADED, batches.append)
+    manager.register(FirstPlugin)
+    manager.register(SecondPlugin)
+
+    assert manager.load_all(batch_events=True) == ["first", "second"]
+    assert loaded_events == []
+    assert batches == [
+        {
+            "plugins": [
+                {"plugin_name": "first", "version": "1.0.0"},
+                {"plugin_name": "second", "version": "2.0.0"},
+            ]
+        }
+    ]
+
+    manager.unload_all()
+    manager.load_all()
+    assert [event["plugin_name"] for event in loaded_events] == ["first", "second"]
+    assert len(batches) == 2
+
+
+def test_load_all_batch_events_include_nested_loads(manager):
+    """Test plugins loaded from another plugin's on_load are in the batch event."""
+
+    class HelperPlugin(PluginBase):
+        name = "helper"
+
+    class StarterPlugin(PluginBase):
+        name = "starter"
+
+        def on_load(self):
+            manager.load("helper")
+
+    loaded_events = []
+    batches = []
+    manager.register_hook(PluginManager.EVENT_PLUGIN_LOADED, loaded_events.append)
+    manager.register_hook(PluginManager.EVENT_PLUGINS_BATCH_LOADED, batches.append)
+    manager.register(StarterPlugin)
+    manager.register(HelperPlugin)
+
+    assert manager.load_all(batch_events=True) == ["starter"]
+    assert loaded_events == []
+    assert [event["plugin_name"] for event in batches[0]["plugins"]] == ["helper", "starter"]
+
+
+def test_plugin_discovery_definition_order(manager):
+    """Test discovery registers a module's own plugin classes in definition order."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plugin_file = Path(temp_dir) / "ordered_plugin.py"
+        plugin_file.write_text(
+            """
+from collections import OrderedDict
 from nitro_dispatch import PluginBase
 
-class ValidPlugin(PluginBase):
-    name = "valid"
+class ZuluPlugin(PluginBase):
+    name = "zulu"
+
+class AlphaPlugin(PluginBase):
+    name = "alpha"
+
+class Helper:
+    pass
 """
-        (plugin_dir / "valid.py").write_text(plugin_content)
+        )
 
-        # Discovery should skip the directory
-        discovered = manager.discover_plugins(plugin_dir, pattern="*.py")
-        assert "valid" in discovered
+        assert manager.discover_plugins(temp_dir) == ["zulu", "alpha"]
+        assert manager.get_registered_plugins() == ["zulu", "alpha"]
 
 
-def test_plugin_discovery_overall_exception(manager):
-    """Test plugin discovery with overall exception."""
-    import tempfile
-    from pathlib import Path
-    from unittest import mock
+def test_recursive_discovery_walk_matches_rglob():
+    """Test the scandir-based walk finds the same files as Path.glob/rglob."""
+    from nitro_dispatch.core.plugin_manager import _walk_matching
 
     with tempfile.TemporaryDirectory() as temp_dir:
-        plugin_dir = Path(temp_dir)
+        root = Path(temp_dir)
+        for relative in (
+            "a_plugin.py",
+            "notes.txt",
+            "sub/b_plugin.py",
+            "sub/deeper/c_plugin.py",
+            "sub/deeper/c_plugin.pyc",
+            ".hidden/d_plugin.py",
+        ):
+            path = root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        (root / "dir_plugin.py").mkdir()
+
+        walked = sorted(_walk_matching(root, "*_plugin.py"))
+        globbed = sorted(p for p in root.rglob("*_plugin.py") if not p.is_dir())
+        assert walked == globbed
+        assert len(walked) == 4
+
+        top_level = list(_walk_matching(root, "*_plugin.py", recursive=False))
+        assert top_level == [root / "a_plugin.py"]
+
+
+def test_plugin_discovery_same_stem_in_two_directories(manager):
+    """Test same-named plugin files each get their own module."""
+    import sys
 
-        # Mock glob to raise an exception
-        with mock.patch.object(Path, "glob", side_effect=RuntimeError("Glob failed")):
-            with pytest.raises(PluginDiscoveryError) as exc_info:
-                manager.discover_plugins(plugin_dir, pattern="*.py")
-            assert "Plugin discovery failed" in str(exc_info.value)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        for subdir in ("first", "second"):
+            (root / subdir).mkdir()
+            (root / subdir / "collide_plugin.py").write_text(
+                "from nitro_dispatch import PluginBase\n\n"
+                f"class CollidePlugin(PluginBase):\n    name = '{subdir}'\n"
+            )
+
+        discovered = manager.discover_plugins(root, recursive=True)
+
+        assert sorted(discovered) == ["first", "second"]
+        first = manager._plugin_classes["first"]
+        second = manager._plugin_classes["second"]
+        assert first.__module__ != second.__module__
+        assert sys.modules[first.__module__].CollidePlugin is first
+        assert sys.modules[second.__module__].CollidePlugin is second
+
+
+def test_dependency_order_cached_until_registration_changes(manager):
+    """Test load_all reuses the topological order until plugins change."""
+
+    class AppPlugin(PluginBase):
+        name = "app"
+        dependencies = ["db"]
+
+    class DbPlugin(PluginBase):
+        name = "db"
+
+    manager.register(AppPlugin)
+    manager.register(DbPlugin)
+
+    assert manager.load_all() == ["db", "app"]
+    order = manager._dependency_order()
+    manager.unload_all()
+    assert manager.load_all() == ["db", "app"]
+    assert manager._dependency_order() is order
+
+    class CachePlugin(PluginBase):
+        name = "cache"
+        dependencies = ["db"]
+
+    manager.register(CachePlugin)
+    assert manager._dependency_order() is not order
+    assert manager._dependency_order()[0] == ["db", "app", "cache"]
+
+    manager.unregister("app")
+    assert manager._dependency_order()[0] == ["db", "cache"]
+
+
+def test_register_many_defers_registered_events(manager):
+    """Test register_many stores every class before announcing any of them."""
+
+    class PluginA(PluginBase):
+        name = "a"
+
+    class PluginB(PluginBase):
+        name = "b"
+        dependencies = ["a"]
+
+    class NotAPlugin:
+        pass
+
+    seen = []
+
+    def on_registered(data):
+        seen.append((data["plugin_name"], sorted(manager.get_registered_plugins())))
+        return data
+
+    manager.register_hook(manager.EVENT_PLUGIN_REGISTERED, on_registered)
+
+    assert manager.register_many([PluginB, PluginA]) == ["b", "a"]
+    assert seen == [("b", ["a", "b"]), ("a", ["a", "b"])]
+    assert manager.load_all() == ["a", "b"]
+
+    seen.clear()
+
+    class PluginC(PluginBase):
+        name = "c"
+
+    with pytest.raises(PluginRegistrationError):
+        manager.register_many([PluginC, NotAPlugin])
+    assert "c" in manager.get_registered_plugins()
+    assert [name for name, _ in seen] == ["c"]